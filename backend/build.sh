@@ -48,6 +48,14 @@ fi
 # Django migrations
 echo "🔄 Database migrations çalıştırılıyor..."
 python manage.py migrate --noinput
+python manage.py createcachetable
+
+# Budanmış, mmap'lenebilir vektörler (worker'lar tek kopyayı paylaşır)
+if [ "$FASTTEXT_ENABLED" = "true" ] && [ -f "ml_models/cc.tr.300.bin" ]; then
+    echo "✂️  Budanmış FastText vektörleri üretiliyor..."
+    python manage.py export_fasttext_vectors \
+        || echo "⚠️  Budanmış vektörler üretilemedi, tam model kullanılacak"
+fi
 
 # Static dosyalar toplama
 echo "📁 Static dosyalar toplanıyor..."
@@ -0,0 +1,219 @@
+"""
+Approximate nearest-neighbour recall stage over event vectors.
+
+``IVFIndex`` is an inverted-file index written with NumPy: a spherical
+k-means coarse quantizer splits the normalized event vectors into lists and a
+query only scans the ``n_probe`` lists closest to it. The index answers
+"which events are probably most similar to any of these interest vectors";
+exact 0.7/0.3 scoring of those candidates still happens in
+``recommendation_service.score_batch``.
+
+``EventVectorIndex`` keeps one process-local ``IVFIndex`` in sync with the
+``Event`` table. It is built the first time the catalog is large enough to
+use it (``recommendation_pipeline.recall_candidates`` counts first) and
+afterwards updated incrementally (upserts by ``updated_at``, removals by id)
+whenever the recommendation cache's events version or the day changes; the
+day check drops events that became past at midnight, which no event save
+would otherwise trigger.
+"""
+
+import threading
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .models import Event
+from .recommendation_service import (
+    EMBEDDING_DTYPE,
+    embedding_from_bytes,
+    normalize_rows,
+    recommendation_cache,
+)
+
+
+class IVFIndex:
+    """Inverted-file index with exact dot-product scoring inside probed lists."""
+
+    def __init__(self, n_probe: int = 8, iterations: int = 10, seed: int = 0):
+        self.n_probe = n_probe
+        self.iterations = iterations
+        self.seed = seed
+        self.centroids = np.zeros((0, 0), dtype=EMBEDDING_DTYPE)
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.vectors = np.zeros((0, 0), dtype=EMBEDDING_DTYPE)
+        self.lists = np.zeros(0, dtype=np.int32)
+        self.size = 0
+        self.trained_size = 0
+        self._rows: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, event_id: int) -> bool:
+        return event_id in self._rows
+
+    def build(self, ids: Iterable[int], vectors: np.ndarray) -> None:
+        """(Re)train the quantizer and index every vector from scratch."""
+        ids = np.asarray(list(ids), dtype=np.int64)
+        vectors = normalize_rows(vectors)
+        self.centroids = self._train(vectors)
+        self.ids = ids.copy()
+        self.vectors = vectors.copy()
+        self.lists = self._assign(vectors)
+        self.size = len(ids)
+        self.trained_size = self.size
+        self._rows = {int(event_id): row for row, event_id in enumerate(ids)}
+
+    def add(self, event_id: int, vector: np.ndarray) -> None:
+        """Insert or replace one vector; assigned to its nearest existing list."""
+        vector = normalize_rows(np.asarray(vector).reshape(1, -1))
+        if not self.centroids.size:
+            self.build([event_id], vector)
+            return
+        row = self._rows.get(event_id)
+        if row is None:
+            row = self.size
+            self._grow(row + 1)
+            self.ids[row] = event_id
+            self._rows[event_id] = row
+            self.size += 1
+        self.vectors[row] = vector[0]
+        self.lists[row] = self._assign(vector)[0]
+
+    def remove(self, event_id: int) -> None:
+        """Delete one vector in O(1) by moving the last row into its slot."""
+        row = self._rows.pop(event_id, None)
+        if row is None:
+            return
+        last = self.size - 1
+        if row != last:
+            moved = int(self.ids[last])
+            self.ids[row] = moved
+            self.vectors[row] = self.vectors[last]
+            self.lists[row] = self.lists[last]
+            self._rows[moved] = row
+        self.size = last
+
+    @property
+    def needs_retrain(self) -> bool:
+        """Incremental adds drift from the trained lists; retrain after doubling."""
+        return self.size > 2 * max(self.trained_size, 1)
+
+    def search(self, queries: np.ndarray, k: int) -> List[int]:
+        """Ids of the ``k`` vectors with the highest max-similarity to ``queries``."""
+        if not self.size or not len(queries):
+            return []
+        queries = normalize_rows(queries)
+        centroid_scores = queries @ self.centroids.T
+        n_probe = min(self.n_probe, len(self.centroids))
+        probed = np.unique(np.argpartition(-centroid_scores, n_probe - 1, axis=1)[:, :n_probe])
+
+        rows = np.flatnonzero(np.isin(self.lists[: self.size], probed))
+        if not len(rows):
+            return []
+        similarities = (self.vectors[rows] @ queries.T).max(axis=1)
+        if len(rows) > k:
+            best = np.argpartition(-similarities, k - 1)[:k]
+        else:
+            best = np.arange(len(rows))
+        return [int(event_id) for event_id in self.ids[rows[best]]]
+
+    def _train(self, vectors: np.ndarray) -> np.ndarray:
+        n_lists = int(np.clip(np.sqrt(len(vectors)), 1, 1024))
+        rng = np.random.default_rng(self.seed)
+        sample = vectors
+        if len(vectors) > 256 * n_lists:
+            sample = vectors[rng.choice(len(vectors), 256 * n_lists, replace=False)]
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)]
+        for _ in range(self.iterations):
+            assignment = (sample @ centroids.T).argmax(axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            empty = ~np.bincount(assignment, minlength=n_lists).astype(bool)
+            sums[empty] = centroids[empty]
+            centroids = normalize_rows(sums)
+        return centroids
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return (vectors @ self.centroids.T).argmax(axis=1).astype(np.int32)
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self.ids)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity, 64)
+        ids = np.zeros(capacity, dtype=np.int64)
+        vectors = np.zeros((capacity, self.vectors.shape[1]), dtype=EMBEDDING_DTYPE)
+        lists = np.zeros(capacity, dtype=np.int32)
+        ids[: self.size] = self.ids[: self.size]
+        vectors[: self.size] = self.vectors[: self.size]
+        lists[: self.size] = self.lists[: self.size]
+        self.ids, self.vectors, self.lists = ids, vectors, lists
+
+
+class EventVectorIndex:
+    """Process-local ``IVFIndex`` over upcoming events, synced from the database."""
+
+    # updated_at is written by each worker's clock; re-read a small window.
+    SYNC_OVERLAP = timedelta(seconds=5)
+
+    def __init__(self):
+        self.index: Optional[IVFIndex] = None
+        self.version = None
+        self.day = None
+        self.synced_at = None
+        self._lock = threading.Lock()
+
+    def get(self, today) -> IVFIndex:
+        """Return the index, building or incrementally syncing it if stale."""
+        version = recommendation_cache.events_version()
+        with self._lock:
+            if self.index is None or self.index.needs_retrain:
+                self._build(today)
+            elif version != self.version or today != self.day:
+                self._sync(today)
+            self.version = version
+            self.day = today
+            return self.index
+
+    def _upcoming(self, today):
+        return Event.objects.filter(date__gte=today)
+
+    def _build(self, today) -> None:
+        ids, vectors = [], []
+        latest = None
+        rows = (
+            self._upcoming(today)
+            .filter(embedding__isnull=False)
+            .values_list("id", "embedding", "updated_at")
+            .iterator(chunk_size=2000)
+        )
+        for event_id, raw, updated_at in rows:
+            ids.append(event_id)
+            vectors.append(embedding_from_bytes(raw))
+            latest = updated_at if latest is None else max(latest, updated_at)
+        index = IVFIndex()
+        if vectors:
+            index.build(ids, np.vstack(vectors))
+        self.index = index
+        self.synced_at = latest
+
+    def _sync(self, today) -> None:
+        changed = self._upcoming(today)
+        if self.synced_at is not None:
+            changed = changed.filter(updated_at__gte=self.synced_at - self.SYNC_OVERLAP)
+        for event_id, raw, updated_at in changed.values_list("id", "embedding", "updated_at"):
+            vector = embedding_from_bytes(raw)
+            if vector is None:
+                self.index.remove(event_id)
+            else:
+                self.index.add(event_id, vector)
+            self.synced_at = updated_at if self.synced_at is None else max(self.synced_at, updated_at)
+
+        current = set(self._upcoming(today).values_list("id", flat=True))
+        for event_id in [int(i) for i in self.index.ids[: self.index.size] if int(i) not in current]:
+            self.index.remove(event_id)
+
+
+event_vector_index = EventVectorIndex()
@@ -0,0 +1,132 @@
+"""DRF authentication for the SimpleJWT tokens issued by the login views.
+
+Students and clubs live in separate tables with overlapping ids, so the
+login views add a ``role`` claim next to SimpleJWT's ``user_id``.
+``TokenPrincipalAuthentication`` turns a valid ``Authorization: Bearer``
+access token into ``request.user`` (a ``Student`` or ``Club``) without
+touching the auth framework's user model.
+
+Authentication is lenient: a missing, expired, malformed or pre-``role``
+token leaves the request anonymous instead of failing it, and the views
+fall back to the ``student_id`` parameter exactly as before.
+
+Principals are kept in a small process-local cache for
+``AUTH_PRINCIPAL_CACHE_TTL`` seconds, so hot endpoints (recommendations,
+favorites, join) do not look the student up on every request. Saves and
+deletes drop the entry in the current process (see signals.py); other
+processes see the change once the entry expires.
+"""
+
+import copy
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+
+from .models import Club, Student
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_MODELS = {"student": Student, "club": Club}
+
+
+class PrincipalCache:
+    """TTL cache of (role, id) -> model instance; each hit returns a copy."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple[str, int], Tuple[float, object]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _ttl() -> float:
+        return getattr(settings, "AUTH_PRINCIPAL_CACHE_TTL", 30)
+
+    def get(self, role: str, pk) -> Optional[object]:
+        key = (role, int(pk))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                # Views may modify request.user; the cached instance stays clean
+                return copy.copy(entry[1])
+            self.misses += 1
+
+        principal = PRINCIPAL_MODELS[role].objects.filter(pk=key[1]).first()
+        if principal is None:
+            return None
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # Expired entries go first; if none, start over
+                expired = [k for k, (expires, _) in self._entries.items() if expires <= now]
+                for stale in expired:
+                    del self._entries[stale]
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+            self._entries[key] = (now + self._ttl(), copy.copy(principal))
+        return principal
+
+    def invalidate(self, role: str, pk) -> None:
+        with self._lock:
+            self._entries.pop((role, int(pk)), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
+
+
+principal_cache = PrincipalCache()
+
+
+class TokenPrincipalAuthentication(BaseAuthentication):
+    """``Authorization: Bearer <access token>`` -> ``Student`` or ``Club``."""
+
+    keyword = b"bearer"
+
+    def authenticate(self, request):
+        header = get_authorization_header(request).split()
+        if len(header) != 2 or header[0].lower() != self.keyword:
+            return None
+        try:
+            from rest_framework_simplejwt.exceptions import TokenError
+            from rest_framework_simplejwt.settings import api_settings
+            from rest_framework_simplejwt.tokens import AccessToken
+        except ImportError:
+            return None
+
+        try:
+            token = AccessToken(header[1].decode("latin-1"))
+        except (TokenError, UnicodeDecodeError) as exc:
+            logger.debug("Geçersiz erişim token'ı, anonim devam ediliyor: %s", exc)
+            return None
+
+        role = token.get("role")
+        try:
+            principal_id = int(token.get(api_settings.USER_ID_CLAIM))
+        except (TypeError, ValueError):
+            return None
+        if role not in PRINCIPAL_MODELS:
+            return None
+        principal = principal_cache.get(role, principal_id)
+        if principal is None:
+            return None
+        return principal, token
+
+    def authenticate_header(self, request):
+        return 'Bearer realm="api"'
@@ -0,0 +1,26 @@
+"""Version counters in the shared Django cache.
+
+A process-local or keyed cache stamps its entries with a counter read from
+here; bumping the counter (from any worker) makes every stamped entry stale.
+"""
+
+import time
+
+from django.core.cache import cache
+
+
+def get_version(key: str) -> int:
+    version = cache.get(key)
+    if version is None:
+        # Nanosecond start value: an evicted counter never falls back to an
+        # old version number.
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key, 0)
+    return version
+
+
+def bump_version(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
@@ -0,0 +1,71 @@
+"""Opt-in compact format for responses that list events.
+
+By default every event embeds its full club and tag objects, so a page of
+200 events from a handful of clubs repeats the same club 40 times.
+With ``?format=compact`` the events carry ``club_id`` / ``tag_ids`` instead
+and the response gets ``clubs`` and ``tags`` side tables holding each
+referenced object once. ``?expand=club`` or ``?expand=tags`` (comma
+separated) keeps that relation nested; ``expand`` alone also switches the
+compact mode on.
+
+``EventSerializer`` switches its fields when the serializer context holds a
+``SideTables`` collector (see ``compact_context``) and registers every event
+it renders there; the view then merges ``SideTables.as_dict()`` into the
+response with ``with_side_tables``.
+"""
+
+from typing import Dict, Optional, Set
+
+from .serializers import ClubSerializer, TagSerializer
+
+COMPACT_RELATIONS = ("club", "tags")
+
+
+def compact_relations(request) -> Optional[Set[str]]:
+    """Relations to move into side tables; None for the regular format."""
+    params = request.query_params
+    if params.get("format") != "compact" and "expand" not in params:
+        return None
+    expanded = {name.strip() for name in params.get("expand", "").split(",") if name.strip()}
+    compacted = set(COMPACT_RELATIONS) - expanded
+    return compacted or None
+
+
+class SideTables:
+    """Collects the clubs and tags of the rendered events, keyed by id."""
+
+    def __init__(self, relations: Set[str]):
+        self.relations = relations
+        self.clubs: Dict[int, object] = {}
+        self.tags: Dict[int, object] = {}
+
+    def add(self, event) -> None:
+        if "club" in self.relations and event.club_id not in self.clubs:
+            self.clubs[event.club_id] = event.club
+        if "tags" in self.relations:
+            for tag in event.tags.all():
+                self.tags.setdefault(tag.id, tag)
+
+    def as_dict(self) -> dict:
+        tables = {}
+        if "club" in self.relations:
+            tables["clubs"] = ClubSerializer([self.clubs[pk] for pk in sorted(self.clubs)], many=True).data
+        if "tags" in self.relations:
+            tables["tags"] = TagSerializer([self.tags[pk] for pk in sorted(self.tags)], many=True).data
+        return tables
+
+
+def compact_context(request) -> dict:
+    """Serializer context entries for ``request``; empty for the regular format."""
+    relations = compact_relations(request)
+    if relations is None:
+        return {}
+    return {"side_tables": SideTables(relations)}
+
+
+def with_side_tables(payload: dict, context: dict) -> dict:
+    """Add the collected side tables to ``payload`` (after serialization)."""
+    side_tables = context.get("side_tables")
+    if side_tables is not None:
+        payload.update(side_tables.as_dict())
+    return payload
@@ -0,0 +1,221 @@
+"""Persisted FastText vectors for events and student profiles.
+
+Event vectors are computed once when an event is written (queued by
+signals.py, run by the ``run_worker`` command; see tasks.py) or by the
+``backfill_event_embeddings`` command, and stored in
+``Event.embedding`` so recommendation requests only do a lookup.
+
+A student's profile (one row per interest tag name plus one row per event
+they joined) is stored in ``StudentProfileVector``. It is built lazily the
+first time the student is scored and afterwards patched in place: a join
+appends the event's stored vector (in a worker, after the join commits), a
+cancellation drops its row and an interest change re-embeds only the tag
+names. History rows are snapshots of the event vector at join time.
+"""
+
+from itertools import islice
+from typing import Iterable, Optional
+
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Event, Participation, StudentProfileVector, Tag
+from .recommendation_service import (
+    EMBEDDING_DTYPE,
+    embedding_from_bytes,
+    embedding_to_bytes,
+    event_text,
+    get_recommender,
+    matrix_from_bytes,
+    matrix_to_bytes,
+    normalize_rows,
+    recommendation_cache,
+)
+from .task_queue import enqueue
+
+EMBEDDING_SOURCE_FIELDS = {"title", "description"}
+
+
+def refresh_event_embedding(event: Event) -> None:
+    """Recompute and store the vector of a single event.
+
+    Without a loaded model the stored vector is left alone: a process that
+    runs without FastText must not wipe vectors computed elsewhere. If
+    FastText is enabled but the model did not load, ``RuntimeError`` lets the
+    task queue retry later.
+    """
+    recommender = get_recommender()
+    recommender.preload()
+    if not recommender.model_loaded:
+        if recommender.fasttext_enabled():
+            raise RuntimeError("FastText modeli yüklenemedi, etkinlik vektörü hesaplanmadı.")
+        return
+    vector = recommender.embed_event(event.title, event.description)
+    if vector is None and event.embedding is None:
+        return
+    event.embedding = embedding_to_bytes(vector)
+    # updated_at moves too, so the ANN index sync picks the new vector up
+    Event.objects.filter(pk=event.pk).update(embedding=event.embedding, updated_at=timezone.now())
+
+
+def backfill_event_embeddings(queryset, batch_size: int = 500) -> int:
+    """Compute vectors for every event in ``queryset``; returns the count stored.
+
+    ``bulk_update`` sends no ``post_save``, so cached recommendations and the
+    ANN index are invalidated here, once, when anything was stored.
+    """
+    recommender = get_recommender()
+    stored = 0
+    rows = queryset.only("id", "title", "description").iterator(chunk_size=batch_size)
+    while True:
+        events = list(islice(rows, batch_size))
+        if not events:
+            break
+        # One embedding call per batch so shared words are looked up once
+        vectors = recommender.embed_texts([event_text(e.title, e.description) for e in events])
+        batch = []
+        now = timezone.now()
+        for event, vector in zip(events, vectors):
+            if vector is None:
+                continue
+            event.embedding = embedding_to_bytes(vector)
+            # bulk_update skips auto_now; the ANN index sync reads updated_at
+            event.updated_at = now
+            batch.append(event)
+        if batch:
+            Event.objects.bulk_update(batch, ["embedding", "updated_at"])
+            stored += len(batch)
+    if stored:
+        recommendation_cache.invalidate_events()
+    return stored
+
+
+def schedule_event_embeddings(event_ids: Iterable[int], batch_size: int = 500) -> None:
+    """Queue the vectors of bulk-created events, one ``embed_events`` task per batch."""
+    event_ids = list(event_ids)
+    for start in range(0, len(event_ids), batch_size):
+        enqueue("embed_events", event_ids=event_ids[start:start + batch_size])
+
+
+def _event_vector(title, description, raw) -> Optional[np.ndarray]:
+    vector = embedding_from_bytes(raw)
+    if vector is None:
+        vector = get_recommender().embed_event(title, description)
+    return vector
+
+
+def _interest_matrix(student_id: int) -> Optional[np.ndarray]:
+    names = Tag.objects.filter(interested_students=student_id).values_list("name", flat=True)
+    return get_recommender().interest_matrix(list(names), [])
+
+
+def rebuild_student_vectors(student_id: int) -> Optional[StudentProfileVector]:
+    """Build a student's profile from scratch; None (and no row) without a model."""
+    interests = _interest_matrix(student_id)
+    if interests is None:
+        StudentProfileVector.objects.filter(student_id=student_id).delete()
+        return None
+
+    event_ids, vectors = [], []
+    past_events = Event.objects.filter(participations__student_id=student_id).values_list(
+        "id", "title", "description", "embedding"
+    )
+    for event_id, title, description, raw in past_events:
+        vector = _event_vector(title, description, raw)
+        if vector is not None:
+            event_ids.append(event_id)
+            vectors.append(vector)
+    history = normalize_rows(np.vstack(vectors)) if vectors else np.zeros((0, 0), dtype=EMBEDDING_DTYPE)
+
+    profile, _ = StudentProfileVector.objects.update_or_create(
+        student_id=student_id,
+        defaults={
+            "interest_vectors": matrix_to_bytes(interests),
+            "history_vectors": matrix_to_bytes(history),
+            "history_event_ids": event_ids,
+        },
+    )
+    return profile
+
+
+def student_profile_matrix(student_id: int) -> Optional[np.ndarray]:
+    """Stacked interest + history rows used to score ``student_id``.
+
+    None when the model is not loaded (tag-only scoring), an empty matrix when
+    nothing in the profile could be embedded.
+    """
+    recommender = get_recommender()
+    recommender.preload()
+    if not recommender.model_loaded:
+        return None
+
+    profile = StudentProfileVector.objects.filter(student_id=student_id).first()
+    if profile is None:
+        profile = rebuild_student_vectors(student_id)
+        if profile is None:
+            return None
+
+    parts = [
+        matrix
+        for matrix in (matrix_from_bytes(profile.interest_vectors), matrix_from_bytes(profile.history_vectors))
+        if matrix.size
+    ]
+    if not parts:
+        return np.zeros((0, 0), dtype=EMBEDDING_DTYPE)
+    return np.vstack(parts)
+
+
+def refresh_student_interest_vectors(student_id: int) -> None:
+    """Re-embed the interest rows after the student's interests changed."""
+    with transaction.atomic():
+        profile = StudentProfileVector.objects.select_for_update().filter(student_id=student_id).first()
+        if profile is None:
+            return
+        interests = _interest_matrix(student_id)
+        if interests is None:
+            profile.delete()
+            return
+        profile.interest_vectors = matrix_to_bytes(interests)
+        profile.save(update_fields=["interest_vectors", "updated_at"])
+
+
+def add_student_history_vector(student_id: int, event_id: int) -> bool:
+    """Append the stored vector of an event the student joined.
+
+    Runs in a worker after the join committed (``add_history_vector`` task),
+    so the participation may already be cancelled. Events without a stored
+    vector yet are skipped rather than embedded here; such an event only
+    enters the history when the profile is rebuilt. Returns whether a row
+    was appended.
+    """
+    vector = embedding_from_bytes(Event.objects.filter(pk=event_id).values_list("embedding", flat=True).first())
+    if vector is None:
+        return False
+    with transaction.atomic():
+        profile = StudentProfileVector.objects.select_for_update().filter(student_id=student_id).first()
+        if profile is None or event_id in profile.history_event_ids:
+            return False
+        # Checked under the profile lock, which a cancellation also takes
+        if not Participation.objects.filter(student_id=student_id, event_id=event_id).exists():
+            return False
+        history = matrix_from_bytes(profile.history_vectors)
+        row = normalize_rows(np.asarray(vector, dtype=EMBEDDING_DTYPE).reshape(1, -1))
+        history = np.vstack([history, row]) if history.size else row
+        profile.history_vectors = matrix_to_bytes(history)
+        profile.history_event_ids = profile.history_event_ids + [event_id]
+        profile.save(update_fields=["history_vectors", "history_event_ids", "updated_at"])
+    return True
+
+
+def remove_student_history_vector(student_id: int, event_id: int) -> None:
+    """Drop the row of an event the student no longer participates in."""
+    with transaction.atomic():
+        profile = StudentProfileVector.objects.select_for_update().filter(student_id=student_id).first()
+        if profile is None or event_id not in profile.history_event_ids:
+            return
+        row = profile.history_event_ids.index(event_id)
+        history = np.delete(matrix_from_bytes(profile.history_vectors), row, axis=0)
+        profile.history_vectors = matrix_to_bytes(history)
+        profile.history_event_ids = [i for i in profile.history_event_ids if i != event_id]
+        profile.save(update_fields=["history_vectors", "history_event_ids", "updated_at"])
@@ -0,0 +1,118 @@
+"""Bulk event import shared by ``POST /api/events/bulk/`` and ``import_events``.
+
+Rows are validated in memory, then each batch costs a fixed number of
+queries: one for its clubs, one ``bulk_create`` for the events, the tag
+resolver's (at most) three, one ``bulk_create`` for the event-tag rows and one
+``UPDATE`` for the search vectors. ``bulk_create`` sends no ``post_save``, so
+the work the Event signals would do is done here once per batch.
+"""
+
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+
+from .embeddings import schedule_event_embeddings
+from .models import Club, Event
+from .recommendation_service import recommendation_cache
+from .search import refresh_search_vectors
+from .serializers import EventImportSerializer
+from .tags import normalize_tag_names, resolve_tags
+
+BATCH_SIZE = 500
+
+
+class ImportReport:
+    """Created event ids and per-row errors (rows are 0-based input positions)."""
+
+    def __init__(self):
+        self.rows = 0
+        self.event_ids: List[int] = []
+        self.errors: List[Dict] = []
+
+    def add_error(self, row: int, errors) -> None:
+        self.errors.append({"row": row, "errors": errors})
+
+    def as_dict(self) -> Dict:
+        return {
+            "rows": self.rows,
+            "created": len(self.event_ids),
+            "event_ids": self.event_ids,
+            "errors": self.errors,
+        }
+
+
+def import_events(
+    rows: Iterable[Dict],
+    default_club_id: Optional[int] = None,
+    batch_size: int = BATCH_SIZE,
+    dry_run: bool = False,
+) -> ImportReport:
+    """Validate and create events; invalid rows are reported and skipped."""
+    report = ImportReport()
+    rows = iter(enumerate(rows))
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        report.rows += len(batch)
+        valid = _validate_batch(batch, default_club_id, report)
+        if valid and not dry_run:
+            report.event_ids.extend(_create_batch(valid))
+
+    report.errors.sort(key=lambda error: error["row"])
+    if report.event_ids:
+        recommendation_cache.invalidate_events()
+        schedule_event_embeddings(report.event_ids)
+    return report
+
+
+def _validate_batch(batch, default_club_id, report) -> List[Dict]:
+    validated = []
+    for row, data in batch:
+        if not isinstance(data, dict):
+            report.add_error(row, {"non_field_errors": ["Satır bir JSON nesnesi olmalıdır."]})
+            continue
+        if default_club_id is not None and not data.get("club_id"):
+            data = {**data, "club_id": default_club_id}
+        serializer = EventImportSerializer(data=data)
+        if serializer.is_valid():
+            validated.append((row, serializer.validated_data))
+        else:
+            report.add_error(row, serializer.errors)
+
+    club_ids = {data["club_id"] for _, data in validated}
+    clubs = Club.objects.in_bulk(club_ids)
+    valid = []
+    for row, data in validated:
+        if data["club_id"] not in clubs:
+            report.add_error(row, {"club_id": [f"Geçersiz kulüp id: {data['club_id']}."]})
+        else:
+            valid.append(data)
+    return valid
+
+
+@transaction.atomic
+def _create_batch(valid: List[Dict]) -> List[int]:
+    tag_names = [normalize_tag_names(data.get("tag_names", [])) for data in valid]
+    events = Event.objects.bulk_create(
+        [
+            Event(**{key: value for key, value in data.items() if key != "tag_names"})
+            for data in valid
+        ]
+    )
+
+    tags = {tag.name: tag for tag in resolve_tags(name for names in tag_names for name in names)}
+    EventTag = Event.tags.through
+    EventTag.objects.bulk_create(
+        [
+            EventTag(event_id=event.pk, tag_id=tags[name].pk)
+            for event, names in zip(events, tag_names)
+            for name in names
+        ],
+        ignore_conflicts=True,
+    )
+
+    event_ids = [event.pk for event in events]
+    refresh_search_vectors(Event.objects.filter(pk__in=event_ids))
+    return event_ids
@@ -0,0 +1,141 @@
+"""
+Budanmış (vocabulary-pruned) FastText vektörleri.
+
+``cc.tr.300.bin`` her worker'da birkaç GB RAM ister. ``export_fasttext_vectors``
+komutu sadece etkinlik/tag metinlerinde ve frekans listesinde geçen kelimelerin
+vektörlerini, bu kelimelerin subword n-gram bucket'larıyla birlikte float16
+bir ``.npy`` dosyasına yazar. ``PrunedFastTextVectors`` bu dosyayı
+``np.load(mmap_mode='r')`` ile açar; böylece tüm gunicorn worker'ları işletim
+sisteminin page cache'indeki tek kopyayı paylaşır.
+
+Dosya düzeni:
+    <ad>.npy   float16 (len(words) + len(buckets), dim) matris
+    <ad>.json  {"dim", "minn", "maxn", "bucket", "words", "buckets"}
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+VECTOR_DTYPE = np.float16
+BOW = "<"
+EOW = ">"
+
+
+def fasttext_hash(text: str) -> int:
+    """FastText'in FNV-1a varyantı (byte'lar int8 olarak işaretli genişletilir)."""
+    h = 2166136261
+    for byte in text.encode("utf-8"):
+        h ^= byte if byte < 0x80 else byte | 0xFFFFFF00
+        h = (h * 16777619) & 0xFFFFFFFF
+    return h
+
+
+def subword_buckets(word: str, minn: int, maxn: int, bucket: int) -> List[int]:
+    """Kelimenin karakter n-gram bucket id'leri (FastText computeSubwords ile aynı)."""
+    if bucket <= 0 or maxn <= 0:
+        return []
+    chars = BOW + word + EOW
+    buckets = []
+    for i in range(len(chars)):
+        for n in range(1, maxn + 1):
+            end = i + n
+            if end > len(chars):
+                break
+            if n >= minn and not (n == 1 and (i == 0 or end == len(chars))):
+                buckets.append(fasttext_hash(chars[i:end]) % bucket)
+    return buckets
+
+
+def metadata_path(vectors_path) -> Path:
+    return Path(vectors_path).with_suffix(".json")
+
+
+class PrunedFastTextVectors:
+    """``fasttext`` modelinin ``get_word_vector`` arayüzünü taklit eden mmap okuyucu."""
+
+    def __init__(self, matrix: np.ndarray, meta: Dict):
+        self.matrix = matrix
+        self.dim = int(meta["dim"])
+        self.minn = int(meta["minn"])
+        self.maxn = int(meta["maxn"])
+        self.bucket = int(meta["bucket"])
+        words = meta["words"]
+        self.word_rows = {word: row for row, word in enumerate(words)}
+        self.bucket_rows = {
+            bucket_id: len(words) + row for row, bucket_id in enumerate(meta["buckets"])
+        }
+
+    @classmethod
+    def load(cls, path) -> "PrunedFastTextVectors":
+        matrix = np.load(path, mmap_mode="r")
+        with open(metadata_path(path), encoding="utf-8") as fh:
+            meta = json.load(fh)
+        return cls(matrix, meta)
+
+    def get_dimension(self) -> int:
+        return self.dim
+
+    def get_word_vector(self, word: str) -> np.ndarray:
+        """Kelime vektörü; sözlükte yoksa bilinen n-gram bucket'larının ortalaması.
+
+        Hiçbir bucket'ı bulunamayan kelimeler için KeyError fırlatır; çağıran
+        taraf (``_get_text_embedding``) bu kelimeyi atlar.
+        """
+        row = self.word_rows.get(word)
+        if row is not None:
+            return np.asarray(self.matrix[row], dtype=np.float32)
+
+        rows = [
+            self.bucket_rows[b]
+            for b in subword_buckets(word, self.minn, self.maxn, self.bucket)
+            if b in self.bucket_rows
+        ]
+        if not rows:
+            raise KeyError(word)
+        return np.asarray(self.matrix[sorted(rows)], dtype=np.float32).mean(axis=0)
+
+
+def export_pruned_vectors(model, words: Iterable[str], path, include_subwords: bool = True) -> Dict:
+    """
+    Tam FastText modelinden budanmış vektör dosyasını üretir.
+
+    Args:
+        model: ``fasttext.load_model`` ile yüklenmiş model
+        words: Dışa aktarılacak kelimeler (ön işlenmiş, tekrarsız)
+        path: Hedef ``.npy`` dosyası (yanına ``.json`` yazılır)
+        include_subwords: Sözlük dışı kelimeler için n-gram bucket'ları eklensin mi
+
+    Returns:
+        Yazılan metadata (kelime ve bucket listeleri hariç sayılarla)
+    """
+    args = model.f.getArgs()
+    words = sorted(set(words))
+    dim = model.get_dimension()
+    minn, maxn, bucket = args.minn, args.maxn, args.bucket
+    nwords = len(model.get_words())
+
+    buckets = set()
+    if include_subwords:
+        for word in words:
+            buckets.update(subword_buckets(word, minn, maxn, bucket))
+    buckets = sorted(buckets)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    matrix = np.lib.format.open_memmap(
+        path, mode="w+", dtype=VECTOR_DTYPE, shape=(len(words) + len(buckets), dim)
+    )
+    for row, word in enumerate(words):
+        matrix[row] = model.get_word_vector(word)
+    for row, bucket_id in enumerate(buckets, start=len(words)):
+        matrix[row] = model.get_input_vector(nwords + bucket_id)
+    matrix.flush()
+    del matrix
+
+    meta = {"dim": dim, "minn": minn, "maxn": maxn, "bucket": bucket, "words": words, "buckets": buckets}
+    with open(metadata_path(path), "w", encoding="utf-8") as fh:
+        json.dump(meta, fh, ensure_ascii=False)
+    return {"words": len(words), "buckets": len(buckets), "dim": dim}
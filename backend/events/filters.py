@@ -0,0 +1,52 @@
+"""Query-string filters for the event list."""
+
+from datetime import date
+
+from django.db.models import Exists, OuterRef
+from rest_framework.exceptions import ValidationError
+
+from .models import Event
+from .tags import normalize_tag_name
+
+EXACT_FILTERS = ("city", "university", "category")
+
+
+def _parse_date(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValidationError({name: "Tarih YYYY-MM-DD biçiminde olmalıdır."})
+
+
+def filter_events(queryset, params):
+    """Apply ``?city=&university=&category=&club=&tag=&date_from=&date_to=``.
+
+    ``tag`` may be repeated; an event matches if it has any of the tags.
+    """
+    for field in EXACT_FILTERS:
+        value = params.get(field)
+        if value:
+            queryset = queryset.filter(**{field: value})
+
+    club_id = params.get("club")
+    if club_id:
+        if not club_id.isdigit():
+            raise ValidationError({"club": "Geçersiz kulüp id."})
+        queryset = queryset.filter(club_id=int(club_id))
+
+    tag_names = [name for name in map(normalize_tag_name, params.getlist("tag")) if name]
+    if tag_names:
+        # EXISTS instead of a join, so no DISTINCT is needed
+        tagged = Event.tags.through.objects.filter(event_id=OuterRef("pk"), tag__name__in=tag_names)
+        queryset = queryset.filter(Exists(tagged))
+
+    date_from = _parse_date(params, "date_from")
+    if date_from:
+        queryset = queryset.filter(date__gte=date_from)
+    date_to = _parse_date(params, "date_to")
+    if date_to:
+        queryset = queryset.filter(date__lte=date_to)
+    return queryset
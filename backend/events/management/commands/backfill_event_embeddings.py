@@ -0,0 +1,34 @@
+"""Compute and store FastText vectors for existing events."""
+
+from django.core.management.base import BaseCommand
+
+from events.embeddings import backfill_event_embeddings
+from events.models import Event, StudentProfileVector
+from events.recommendation_service import get_recommender
+
+
+class Command(BaseCommand):
+    help = "Compute Event.embedding for events that do not have one yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Recompute vectors for every event, not only missing ones.")
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows per bulk update.")
+
+    def handle(self, *args, **options):
+        recommender = get_recommender()
+        recommender._load_model()
+        if not recommender.model_loaded:
+            self.stdout.write(self.style.WARNING("FastText modeli yüklenemedi, vektör hesaplanmadı."))
+            return
+
+        queryset = Event.objects.all()
+        if not options["all"]:
+            queryset = queryset.filter(embedding__isnull=True)
+
+        stored = backfill_event_embeddings(queryset, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"{stored} etkinlik vektörü kaydedildi."))
+
+        if options["all"]:
+            # Profile history rows are copies of event vectors; rebuild them lazily.
+            deleted, _ = StudentProfileVector.objects.all().delete()
+            self.stdout.write(f"{deleted} öğrenci profil vektörü sıfırlandı.")
@@ -0,0 +1,112 @@
+"""Measure recall@k and latency of the ANN recall stage against exhaustive scoring."""
+
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from events.ann_index import IVFIndex
+from events.models import Event, Student
+from events.embeddings import student_profile_matrix
+from events.recommendation_service import (
+    embedding_from_bytes,
+    normalize_rows,
+    rank_scores,
+    score_batch,
+)
+
+
+class Command(BaseCommand):
+    help = "Report recall@k of the IVF index + exact rescoring versus exhaustive scoring."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=20000, help="Synthetic event count.")
+        parser.add_argument("--dim", type=int, default=300)
+        parser.add_argument("--clusters", type=int, default=200, help="Topic clusters in synthetic data.")
+        parser.add_argument("--queries", type=int, default=100, help="Synthetic students.")
+        parser.add_argument("--interests", type=int, default=5, help="Interest vectors per synthetic student.")
+        parser.add_argument("--top-k", type=int, default=50)
+        parser.add_argument("--recall-k", type=int, default=500, help="Candidates taken from the index.")
+        parser.add_argument("--n-probe", type=int, default=8)
+        parser.add_argument("--from-db", action="store_true", help="Use stored event vectors and real student profiles.")
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options["seed"])
+        if options["from_db"]:
+            ids, vectors, queries = self._from_db()
+        else:
+            ids, vectors, queries = self._synthetic(rng, options)
+        top_k = options["top_k"]
+
+        started = time.perf_counter()
+        index = IVFIndex(n_probe=options["n_probe"])
+        index.build(ids, vectors)
+        build_time = time.perf_counter() - started
+        self.stdout.write(f"{len(ids)} etkinlik, {len(index.centroids)} liste, indeks {build_time:.2f}s")
+
+        self._report("build", index, ids, vectors, queries, top_k, options["recall_k"])
+
+        # Incremental path: drop 10% of the events and add them back one by one.
+        changed = rng.choice(len(ids), max(1, len(ids) // 10), replace=False)
+        for row in changed:
+            index.remove(ids[row])
+        for row in changed:
+            index.add(ids[row], vectors[row])
+        self._report("incremental", index, ids, vectors, queries, top_k, options["recall_k"])
+
+    def _report(self, label, index, ids, vectors, queries, top_k, recall_k):
+        normalized = normalize_rows(vectors)
+        position = {event_id: row for row, event_id in enumerate(ids)}
+        recalls, exhaustive_times, ann_times = [], [], []
+        for interest_matrix in queries:
+            interest_matrix = normalize_rows(interest_matrix)
+            zeros = np.zeros(len(ids))
+
+            started = time.perf_counter()
+            exact = rank_scores(ids, score_batch(normalized, interest_matrix, zeros), top_k)
+            exhaustive_times.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            recalled = index.search(interest_matrix, recall_k)
+            rows = [position[event_id] for event_id in recalled]
+            approx = rank_scores(recalled, score_batch(normalized[rows], interest_matrix, np.zeros(len(rows))), top_k)
+            ann_times.append(time.perf_counter() - started)
+
+            expected = {event_id for event_id, _ in exact}
+            recalls.append(len(expected & {event_id for event_id, _ in approx}) / max(len(expected), 1))
+
+        self.stdout.write(
+            f"[{label}] recall@{top_k}: {np.mean(recalls):.3f} (min {np.min(recalls):.3f}), "
+            f"exhaustive {np.mean(exhaustive_times) * 1000:.1f} ms, "
+            f"ann {np.mean(ann_times) * 1000:.1f} ms"
+        )
+
+    def _synthetic(self, rng, options):
+        dim = options["dim"]
+        centers = rng.standard_normal((options["clusters"], dim)).astype(np.float32)
+        labels = rng.integers(0, len(centers), options["events"])
+        vectors = centers[labels] + 0.6 * rng.standard_normal((options["events"], dim)).astype(np.float32)
+        queries = []
+        for _ in range(options["queries"]):
+            topics = rng.integers(0, len(centers), options["interests"])
+            queries.append(centers[topics] + 0.6 * rng.standard_normal((len(topics), dim)).astype(np.float32))
+        return list(range(options["events"])), vectors, queries
+
+    def _from_db(self):
+        rows = Event.objects.filter(embedding__isnull=False).values_list("id", "embedding")
+        ids, vectors = [], []
+        for event_id, raw in rows.iterator():
+            ids.append(event_id)
+            vectors.append(embedding_from_bytes(raw))
+        if not vectors:
+            raise CommandError("Kayıtlı etkinlik vektörü yok; önce backfill_event_embeddings çalıştırın.")
+
+        queries = []
+        for student in Student.objects.filter(interests__isnull=False).distinct()[:200]:
+            matrix = student_profile_matrix(student.pk)
+            if matrix is not None and matrix.size:
+                queries.append(matrix)
+        if not queries:
+            raise CommandError("İlgi alanı vektörü hesaplanabilen öğrenci yok (model yüklü mü?).")
+        return ids, np.vstack(vectors), queries
@@ -0,0 +1,117 @@
+"""Compare EventSerializer(many=True) with the event_rows fast path."""
+
+import random
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from events.event_rows import event_rows
+from events.models import Club, Event, Tag
+from events.serializers import EventSerializer
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Render synthetic event lists with EventSerializer and with event_rows, check the "
+        "JSON bytes are identical and report time and queries. Runs in a rolled-back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+        parser.add_argument("--clubs", type=int, default=50)
+        parser.add_argument("--tags", type=int, default=200)
+        parser.add_argument("--tags-per-event", type=int, default=4)
+        parser.add_argument("--repeat", type=int, default=3, help="Runs per size; the median is reported.")
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                event_ids = self._create_events(max(options["sizes"]), options)
+                self._compare(event_ids, options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def _create_events(self, count, options):
+        rng = random.Random(options["seed"])
+        run_id = uuid.uuid4().hex[:8]
+        clubs = Club.objects.bulk_create(
+            Club(
+                name=f"bench-{run_id}-{i}",
+                university=f"Üniversite {i % 7}",
+                city="İstanbul",
+                description="Kulüp açıklaması " * 10,
+                email=f"club{i}@example.com",
+                password="!",
+            )
+            for i in range(options["clubs"])
+        )
+        tags = Tag.objects.bulk_create(Tag(name=f"bench {run_id} etiket {i}") for i in range(options["tags"]))
+        start = timezone.localdate()
+        events = Event.objects.bulk_create(
+            Event(
+                club=rng.choice(clubs),
+                title=f"Etkinlik {i}",
+                category=rng.choice(["Teknoloji", "Müzik", "Spor", "Sanat"]),
+                description="Açıklama metni " * 20,
+                city="İstanbul",
+                university="Galatasaray Üniversitesi",
+                date=start + timedelta(days=i % 365),
+                map_url="https://maps.example.com/?q=gsu",
+                capacity=100,
+                participants_count=rng.randint(0, 100),
+            )
+            for i in range(count)
+        )
+        through = Event.tags.through
+        through.objects.bulk_create(
+            through(event_id=event.pk, tag_id=tag.pk)
+            for event in events
+            for tag in rng.sample(tags, options["tags_per_event"])
+        )
+        return [event.pk for event in events]
+
+    def _compare(self, event_ids, options):
+        renderer = JSONRenderer()
+        self.stdout.write(f"{'events':>7} {'drf (ms)':>10} {'fast (ms)':>10} {'speedup':>8} {'queries':>9}  aynı JSON")
+        for size in options["sizes"]:
+            ids = event_ids[:size]
+            drf_times, fast_times = [], []
+            for _ in range(options["repeat"]):
+                with CaptureQueriesContext(connection) as drf_queries:
+                    started = time.perf_counter()
+                    events = Event.objects.filter(pk__in=ids).select_related("club").prefetch_related("tags")
+                    events = self._ordered(events, ids)
+                    drf_bytes = renderer.render(EventSerializer(events, many=True).data)
+                    drf_times.append(time.perf_counter() - started)
+
+                with CaptureQueriesContext(connection) as fast_queries:
+                    started = time.perf_counter()
+                    fast_bytes = renderer.render(event_rows(ids))
+                    fast_times.append(time.perf_counter() - started)
+
+            drf_ms = statistics.median(drf_times) * 1000
+            fast_ms = statistics.median(fast_times) * 1000
+            same = drf_bytes == fast_bytes
+            line = (
+                f"{size:>7} {drf_ms:>10.1f} {fast_ms:>10.1f} {drf_ms / fast_ms:>7.1f}x "
+                f"{len(drf_queries.captured_queries):>4}/{len(fast_queries.captured_queries):<4}  {same}"
+            )
+            self.stdout.write(self.style.SUCCESS(line) if same else self.style.WARNING(line))
+
+    @staticmethod
+    def _ordered(events, ids):
+        by_id = {event.pk: event for event in events}
+        return [by_id[pk] for pk in ids if pk in by_id]
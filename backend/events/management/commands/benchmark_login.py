@@ -0,0 +1,142 @@
+"""Measure login throughput and latency of StudentLoginView under concurrency."""
+
+import queue
+import statistics
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from rest_framework.test import APIRequestFactory
+
+from events import passwords
+from events.models import Student
+from events.views import StudentLoginView
+
+PASSWORD = "benchmark-Sifre-123"
+
+
+class Command(BaseCommand):
+    help = (
+        "Create throwaway students whose passwords are stored with --stored-hasher, log them "
+        "in concurrently through StudentLoginView (first logins upgrade the hash to the "
+        "configured policy) and report logins/s and latency percentiles."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--students", type=int, default=50)
+        parser.add_argument("--logins", type=int, default=300, help="Logins in the steady-state phase.")
+        parser.add_argument("--threads", type=int, default=8, help="Concurrent request threads (gthread threads).")
+        parser.add_argument(
+            "--stored-hasher",
+            default="pbkdf2_sha256",
+            help="Algorithm of the existing hashes, e.g. pbkdf2_sha256 or argon2.",
+        )
+        parser.add_argument(
+            "--hash-concurrency",
+            type=int,
+            help="Override PASSWORD_HASH_CONCURRENCY for this run.",
+        )
+        parser.add_argument("--keep", action="store_true", help="Do not delete the generated rows.")
+
+    def handle(self, *args, **options):
+        try:
+            stored = make_password(PASSWORD, hasher=options["stored_hasher"])
+        except ValueError as exc:
+            raise CommandError(f"Hasher kullanılamıyor: {exc}")
+        concurrency = options["hash_concurrency"] or getattr(settings, "PASSWORD_HASH_CONCURRENCY", 2)
+        if options["hash_concurrency"]:
+            passwords._hash_slots = threading.BoundedSemaphore(concurrency)
+
+        preferred = get_hasher("default")
+        self.stdout.write(
+            f"Politika: {preferred.algorithm}, eski hash: {identify_hasher(stored).algorithm}, "
+            f"hash eşzamanlılığı: {concurrency}"
+        )
+        self._single_hash_cost(stored, preferred)
+
+        run_id = uuid.uuid4().hex[:8]
+        students = Student.objects.bulk_create(
+            Student(
+                email=f"loginbench-{run_id}-{i}@example.com",
+                username=f"loginbench-{run_id}-{i}",
+                university="loginbench",
+                department="loginbench",
+                password=stored,
+            )
+            for i in range(options["students"])
+        )
+        try:
+            emails = [student.email for student in students]
+            self._phase("İlk giriş (rehash)", emails, options["threads"])
+            upgraded = sum(
+                identify_hasher(encoded).algorithm == preferred.algorithm
+                for encoded in Student.objects.filter(pk__in=[s.pk for s in students]).values_list("password", flat=True)
+            )
+            self.stdout.write(f"  {upgraded}/{len(students)} hash {preferred.algorithm} politikasına taşındı")
+            steady = [emails[i % len(emails)] for i in range(options["logins"])]
+            self._phase("Sabit durum", steady, options["threads"])
+        finally:
+            if not options["keep"]:
+                Student.objects.filter(pk__in=[s.pk for s in students]).delete()
+
+    def _single_hash_cost(self, stored, preferred):
+        for label, encoded in (("eski hash", stored), (preferred.algorithm, make_password(PASSWORD))):
+            started = time.perf_counter()
+            for _ in range(5):
+                check_password(PASSWORD, encoded)
+            self.stdout.write(f"Tek doğrulama ({label}): {(time.perf_counter() - started) / 5 * 1000:.1f} ms")
+
+    def _phase(self, label, emails, thread_count):
+        view = StudentLoginView.as_view()
+        factory = APIRequestFactory()
+        work = queue.Queue()
+        for email in emails:
+            work.put(email)
+        latencies, failures = [], []
+        lock = threading.Lock()
+        barrier = threading.Barrier(thread_count)
+
+        def worker():
+            try:
+                barrier.wait()
+                while True:
+                    try:
+                        email = work.get_nowait()
+                    except queue.Empty:
+                        return
+                    request = factory.post(
+                        "/api/auth/student-login/", {"email": email, "password": PASSWORD}, format="json"
+                    )
+                    started = time.perf_counter()
+                    response = view(request)
+                    elapsed = time.perf_counter() - started
+                    with lock:
+                        latencies.append(elapsed)
+                        if response.status_code != 200:
+                            failures.append(response.status_code)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        total = time.perf_counter() - started
+
+        latencies.sort()
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        line = (
+            f"{label}: {len(latencies)} giriş, {thread_count} thread, {total:.2f}s "
+            f"({len(latencies) / total:.1f} giriş/s), p50 {statistics.median(latencies) * 1000:.0f} ms, "
+            f"p95 {p95 * 1000:.0f} ms"
+        )
+        if failures:
+            self.stdout.write(self.style.WARNING(f"{line}, {len(failures)} başarısız"))
+        else:
+            self.stdout.write(self.style.SUCCESS(line))
@@ -0,0 +1,63 @@
+"""Benchmark the batched recommendation scorer against the per-pair loop."""
+
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from events.recommendation_service import normalize_rows, rank_scores, score_batch
+
+
+def legacy_scores(event_vectors, interest_vectors, tag_overlaps):
+    """The original per-(event, interest) cosine loop, kept for comparison."""
+    scores = []
+    for event_vec, tag_overlap in zip(event_vectors, tag_overlaps):
+        max_similarity = 0.0
+        for interest_vec in interest_vectors:
+            norm1 = np.linalg.norm(event_vec)
+            norm2 = np.linalg.norm(interest_vec)
+            if norm1 == 0 or norm2 == 0:
+                similarity = 0.0
+            else:
+                similarity = float(np.dot(event_vec, interest_vec) / (norm1 * norm2))
+            max_similarity = max(max_similarity, similarity)
+        scores.append(max_similarity * 0.7 + min(tag_overlap * 0.05, 0.3))
+    return scores
+
+
+class Command(BaseCommand):
+    help = "Compare per-pair cosine scoring with the batched matmul scorer on synthetic vectors."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Candidate event counts.")
+        parser.add_argument("--interests", type=int, default=10, help="Interest/past-event vectors per student.")
+        parser.add_argument("--dim", type=int, default=300, help="Vector dimension.")
+        parser.add_argument("--top-k", type=int, default=50)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options["seed"])
+        dim = options["dim"]
+        top_k = options["top_k"]
+        interest_vectors = rng.standard_normal((options["interests"], dim)).astype(np.float32)
+
+        self.stdout.write(f"{'events':>8} {'loop (s)':>10} {'batch (s)':>10} {'speedup':>8}  same top-{top_k}")
+        for size in options["sizes"]:
+            event_vectors = rng.standard_normal((size, dim)).astype(np.float32)
+            tag_overlaps = rng.integers(0, 4, size=size)
+            event_ids = list(range(size))
+
+            started = time.perf_counter()
+            loop = legacy_scores(event_vectors, interest_vectors, tag_overlaps)
+            loop_ranking = sorted(zip(event_ids, loop), key=lambda x: x[1], reverse=True)[:top_k]
+            loop_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            scores = score_batch(normalize_rows(event_vectors), normalize_rows(interest_vectors), tag_overlaps)
+            batch_ranking = rank_scores(event_ids, scores, top_k)
+            batch_time = time.perf_counter() - started
+
+            same = [eid for eid, _ in loop_ranking] == [eid for eid, _ in batch_ranking]
+            self.stdout.write(
+                f"{size:>8} {loop_time:>10.4f} {batch_time:>10.4f} {loop_time / batch_time:>7.1f}x  {'evet' if same else 'HAYIR'}"
+            )
@@ -0,0 +1,84 @@
+"""Run EXPLAIN ANALYZE on the hot query paths and report plan and timing."""
+
+import re
+from urllib.parse import urlencode
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Value
+from django.db.models.functions import Lower
+from django.http import QueryDict
+from django.utils import timezone
+
+from events.filters import filter_events
+from events.models import Club, Event, Participation, Student
+from events.participation_service import waiting_positions_queryset
+from events.recommendation_pipeline import candidate_queryset, student_tag_ids
+
+TIMING = re.compile(r"Execution Time: ([\d.]+) ms")
+INDEX_SCAN = re.compile(r"Index(?: Only)? Scan(?: Backward)? using (\w+)|Bitmap Index Scan on (\w+)")
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN ANALYZE the recommendation, event list, login and waitlist queries against "
+        "the current data and print each plan with its execution time. PostgreSQL only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verbose-plans", action="store_true", help="Print the full plan of every query.")
+        parser.add_argument(
+            "--no-seqscan",
+            action="store_true",
+            help="SET enable_seqscan = off, to check an index is usable on small seed data.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("EXPLAIN ANALYZE raporu PostgreSQL gerektirir.")
+
+        student = Student.objects.order_by("id").first()
+        club = Club.objects.order_by("id").first()
+        event = Event.objects.order_by("-participants_count", "id").first()
+        if not (student and club and event):
+            raise CommandError("Veri yok; önce seed_demo çalıştırın.")
+        today = timezone.localdate()
+
+        queries = [
+            ("öneri adayları (date >= bugün)", candidate_queryset(student_tag_ids(student), today)
+                .values_list("id", "title", "description", "tag_overlap", "embedding")),
+            ("etkinlik listesi ilk sayfa", Event.objects.order_by("date", "id")[:50]),
+            ("etkinlik listesi şehir filtresi", filter_events(
+                Event.objects.all(), QueryDict(urlencode({"city": event.city, "date_from": today.isoformat()}))
+            ).order_by("date", "id")[:50]),
+            ("öğrenci girişi (LOWER(email))", Student.objects.annotate(email_lower=Lower("email"))
+                .filter(email_lower=Lower(Value(student.email.upper())))),
+            ("kulüp girişi (LOWER(university), LOWER(name))", Club.objects
+                .annotate(university_lower=Lower("university"), name_lower=Lower("name"))
+                .filter(university_lower=Lower(Value(club.university)), name_lower=Lower(Value(club.name)))),
+            ("bekleme listesi sırası", waiting_positions_queryset([event.pk])),
+            ("öğrencinin katılımları", Participation.objects.filter(student=student)
+                .select_related("event", "event__club").order_by("-created_at")),
+        ]
+
+        with transaction.atomic():
+            if options["no_seqscan"]:
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+            for label, queryset in queries:
+                plan = queryset.explain(analyze=True, buffers=True)
+                self._report(label, plan, options["verbose_plans"])
+
+    def _report(self, label, plan, verbose):
+        timing = TIMING.search(plan)
+        indexes = sorted({a or b for a, b in INDEX_SCAN.findall(plan)})
+        seq_scans = sorted(set(re.findall(r"Seq Scan on (\w+)", plan)))
+        summary = f"{label}: {timing.group(1) if timing else '?'} ms"
+        if indexes:
+            summary += f", indeks: {', '.join(indexes)}"
+        if seq_scans:
+            summary += f", seq scan: {', '.join(seq_scans)}"
+        self.stdout.write(self.style.SUCCESS(summary) if not seq_scans else self.style.WARNING(summary))
+        if verbose:
+            self.stdout.write(plan)
+            self.stdout.write("")
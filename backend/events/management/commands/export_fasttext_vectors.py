@@ -0,0 +1,71 @@
+"""Export a vocabulary-pruned float16 copy of the FastText model."""
+
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from events.fasttext_vectors import export_pruned_vectors
+from events.models import Event, Tag
+from events.recommendation_service import get_recommender
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the vectors of words seen in events, tags and an optional frequency list "
+        "(plus their subword n-gram buckets) to a memory-mappable float16 .npy file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", default=settings.FASTTEXT_MODEL_PATH, help="Full FastText .bin model.")
+        parser.add_argument("--output", default=settings.FASTTEXT_VECTORS_PATH, help="Target .npy file.")
+        parser.add_argument(
+            "--wordlist",
+            help="Frequency list, one word per line (optionally 'word count'), most frequent first.",
+        )
+        parser.add_argument("--top", type=int, default=50000, help="Words to take from --wordlist.")
+        parser.add_argument("--no-subwords", action="store_true", help="Skip n-gram buckets for out-of-vocabulary words.")
+
+    def handle(self, *args, **options):
+        try:
+            import fasttext
+        except ImportError:
+            raise CommandError("FastText kütüphanesi bulunamadı: pip install fasttext")
+
+        model_path = options["model"]
+        if not os.path.exists(model_path):
+            raise CommandError(f"FastText model dosyası bulunamadı: {model_path}")
+
+        words = self._collect_vocabulary(options.get("wordlist"), options["top"])
+        self.stdout.write(f"{len(words)} kelime toplandı, model yükleniyor: {model_path}")
+
+        model = fasttext.load_model(model_path)
+        info = export_pruned_vectors(
+            model, words, options["output"], include_subwords=not options["no_subwords"]
+        )
+        size_mb = os.path.getsize(options["output"]) / (1024 * 1024)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{options['output']} yazıldı: {info['words']} kelime, "
+                f"{info['buckets']} n-gram bucket, {info['dim']} boyut ({size_mb:.1f} MB)."
+            )
+        )
+
+    def _collect_vocabulary(self, wordlist, top):
+        preprocess = get_recommender()._preprocess_turkish_text
+        words = set()
+
+        for title, description in Event.objects.values_list("title", "description").iterator():
+            words.update(preprocess(f"{title} {description}").split())
+        for name in Tag.objects.values_list("name", flat=True):
+            words.update(preprocess(name).split())
+
+        if wordlist:
+            with open(wordlist, encoding="utf-8") as fh:
+                for index, line in enumerate(fh):
+                    if index >= top:
+                        break
+                    parts = preprocess(line).split()
+                    if parts:
+                        words.add(parts[0])
+        return words
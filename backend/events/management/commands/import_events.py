@@ -0,0 +1,92 @@
+"""Import events from a JSON Lines, JSON array or CSV file."""
+
+import csv
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from events.event_import import BATCH_SIZE, import_events
+
+CSV_TAG_SEPARATOR = ";"
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-create events from a .jsonl, .json (array) or .csv file (columns: title, category, description, city, "
+        f"university, date, map_url, capacity, club_id, tag_names separated by '{CSV_TAG_SEPARATOR}')."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Input file.")
+        parser.add_argument("--format", choices=["jsonl", "json", "csv"], help="Defaults to the file extension.")
+        parser.add_argument("--club", type=int, help="club_id for rows that do not set one.")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument("--dry-run", action="store_true", help="Validate only, create nothing.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"Dosya bulunamadı: {path}")
+        fmt = options["format"] or os.path.splitext(path)[1].lstrip(".").lower()
+        readers = {"jsonl": self._read_jsonl, "json": self._read_json, "csv": self._read_csv}
+        if fmt not in readers:
+            raise CommandError("Desteklenen biçimler: jsonl, json, csv (--format ile belirtin).")
+
+        # The importer numbers rows by position; errors are reported with the
+        # file line (jsonl, csv) or the 1-based array index (json) instead.
+        positions = []
+        with open(path, encoding="utf-8", newline="") as fh:
+            report = import_events(
+                self._numbered(readers[fmt](fh), positions),
+                default_club_id=options["club"],
+                batch_size=options["batch_size"],
+                dry_run=options["dry_run"],
+            )
+
+        label = "Kayıt" if fmt == "json" else "Satır"
+        for error in report.errors:
+            errors = json.dumps(error["errors"], ensure_ascii=False)
+            self.stdout.write(self.style.WARNING(f"{label} {positions[error['row']]}: {errors}"))
+        valid = report.rows - len(report.errors)
+        if options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"{report.rows} satırdan {valid} tanesi geçerli (dry-run)."))
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"{report.rows} satırdan {len(report.event_ids)} etkinlik oluşturuldu, {len(report.errors)} hatalı.")
+            )
+
+    @staticmethod
+    def _numbered(rows, positions):
+        for position, row in rows:
+            positions.append(position)
+            yield row
+
+    def _read_jsonl(self, fh):
+        for line_number, line in enumerate(fh, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError:
+                # Reported as a row error by the importer
+                yield line_number, None
+
+    def _read_json(self, fh):
+        try:
+            data = json.load(fh)
+        except json.JSONDecodeError as exc:
+            raise CommandError(f"Geçersiz JSON: {exc}")
+        if not isinstance(data, list):
+            raise CommandError("JSON dosyası etkinliklerden oluşan bir liste olmalıdır.")
+        yield from enumerate(data, start=1)
+
+    def _read_csv(self, fh):
+        reader = csv.DictReader(fh)
+        for row in reader:
+            row = {key: value for key, value in row.items() if value not in (None, "")}
+            tag_names = row.pop("tag_names", "")
+            row["tag_names"] = [name for name in tag_names.split(CSV_TAG_SEPARATOR) if name.strip()]
+            # line_num is the last physical line of the record
+            yield reader.line_num, row
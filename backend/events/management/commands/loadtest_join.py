@@ -0,0 +1,145 @@
+"""Hammer one event with concurrent joins and check the counters stay exact."""
+
+import queue
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+from events.models import Club, Event, Participation, Student
+from events.participation_service import join_event
+
+
+def unlocked_join(event_id, student):
+    """The pre-engine join: unlocked read, increment in Python, save."""
+    event = Event.objects.get(pk=event_id)
+    with transaction.atomic():
+        participation, created = Participation.objects.get_or_create(student=student, event=event)
+        if not created:
+            return
+        if event.is_full:
+            participation.status = Participation.STATUS_WAITLISTED
+            event.waiting_list_count += 1
+        else:
+            participation.status = Participation.STATUS_CONFIRMED
+            event.participants_count += 1
+        participation.save()
+        event.save(update_fields=["participants_count", "waiting_list_count", "updated_at"])
+
+
+class Command(BaseCommand):
+    help = (
+        "Create a throwaway event and students, join them concurrently from worker threads "
+        "(one database connection each) and verify capacity and counters. PostgreSQL only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--students", type=int, default=200, help="Join attempts (one student each).")
+        parser.add_argument("--threads", type=int, default=64, help="Concurrent connections.")
+        parser.add_argument("--capacity", type=int, default=50)
+        parser.add_argument("--repeat", type=int, default=2, help="Times each student tries to join.")
+        parser.add_argument("--unsafe", action="store_true", help="Use the old unlocked join for comparison.")
+        parser.add_argument("--keep", action="store_true", help="Do not delete the generated rows.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Bu yük testi PostgreSQL gerektirir (satır kilidi).")
+
+        run_id = uuid.uuid4().hex[:8]
+        club = Club.objects.create(name=f"loadtest-{run_id}", university="loadtest", password="!")
+        event = Event.objects.create(
+            club=club,
+            title=f"loadtest {run_id}",
+            category="loadtest",
+            city="loadtest",
+            university="loadtest",
+            date=timezone.localdate() + timedelta(days=1),
+            capacity=options["capacity"],
+        )
+        students = Student.objects.bulk_create(
+            Student(
+                email=f"loadtest-{run_id}-{i}@example.com",
+                username=f"loadtest-{run_id}-{i}",
+                university="loadtest",
+                department="loadtest",
+                password="!",
+            )
+            for i in range(options["students"])
+        )
+        try:
+            elapsed, errors = self._run(event.pk, students, options)
+            self._report(event, students, elapsed, errors, options)
+        finally:
+            if not options["keep"]:
+                Student.objects.filter(pk__in=[s.pk for s in students]).delete()
+                club.delete()
+
+    def _run(self, event_id, students, options):
+        join = unlocked_join if options["unsafe"] else (lambda pk, s: join_event(Event(pk=pk), s))
+        work = queue.Queue()
+        for _ in range(options["repeat"]):
+            for student in students:
+                work.put(student)
+        errors = []
+        barrier = threading.Barrier(options["threads"])
+
+        def worker():
+            try:
+                barrier.wait()
+                while True:
+                    try:
+                        student = work.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        join(event_id, student)
+                    except Exception as exc:
+                        errors.append(exc)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker) for _ in range(options["threads"])]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - started, errors
+
+    def _report(self, event, students, elapsed, errors, options):
+        event.refresh_from_db()
+        participations = Participation.objects.filter(event=event)
+        confirmed = participations.filter(status=Participation.STATUS_CONFIRMED).count()
+        waitlisted = participations.filter(status=Participation.STATUS_WAITLISTED).count()
+        attempts = len(students) * options["repeat"]
+
+        self.stdout.write(
+            f"{attempts} katılım denemesi, {options['threads']} thread, {elapsed:.2f}s "
+            f"({attempts / elapsed:.0f} istek/s), {len(errors)} hata"
+        )
+        self.stdout.write(
+            f"Kapasite {event.capacity}: {confirmed} onaylı / {waitlisted} beklemede; "
+            f"sayaçlar {event.participants_count} / {event.waiting_list_count}"
+        )
+        if errors:
+            self.stdout.write(f"İlk hata: {errors[0]!r}")
+
+        expected_confirmed = min(event.capacity, len(students))
+        problems = []
+        if confirmed > event.capacity:
+            problems.append(f"kapasite aşıldı ({confirmed} > {event.capacity})")
+        if confirmed != expected_confirmed or waitlisted != len(students) - expected_confirmed:
+            problems.append("katılım dağılımı beklenenden farklı")
+        if (event.participants_count, event.waiting_list_count) != (confirmed, waitlisted):
+            problems.append("sayaçlar satır sayılarıyla tutarsız")
+        if errors:
+            problems.append("denemelerde hata oluştu")
+
+        if problems:
+            self.stdout.write(self.style.WARNING("BAŞARISIZ: " + "; ".join(problems)))
+        else:
+            self.stdout.write(self.style.SUCCESS("Tutarlı: fazla kayıt yok, sayaçlar kesin."))
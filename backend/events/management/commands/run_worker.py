@@ -0,0 +1,72 @@
+"""Process the database-backed task queue (see events/task_queue.py)."""
+
+import os
+import signal
+import socket
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from events.recommendation_service import get_recommender
+from events.task_queue import claim_tasks, purge_finished_tasks, requeue_stale_tasks, run_task
+
+# Housekeeping (stale requeue, purge) runs at most this often per worker.
+MAINTENANCE_INTERVAL = timedelta(minutes=1)
+
+
+class Command(BaseCommand):
+    help = (
+        "Claim due tasks with SELECT ... FOR UPDATE SKIP LOCKED and run them. "
+        "Several workers can run side by side; stop with SIGINT/SIGTERM."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Exit when no due task is left.")
+        parser.add_argument("--batch", type=int, default=10, help="Tasks claimed per poll.")
+        parser.add_argument("--sleep", type=float, default=1.0, help="Seconds to wait when the queue is empty.")
+        parser.add_argument("--no-preload", action="store_true", help="Do not load the FastText model at start.")
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        if not options["no_preload"]:
+            recommender = get_recommender()
+            recommender.preload()
+            self.stdout.write(f"Model yüklendi: {recommender.model_loaded}")
+        self.stdout.write(f"Worker {worker_id} başladı.")
+
+        succeeded = failed = 0
+        last_maintenance = None
+        while not self.stopping:
+            close_old_connections()
+            now = time.monotonic()
+            if last_maintenance is None or now - last_maintenance >= MAINTENANCE_INTERVAL.total_seconds():
+                requeued = requeue_stale_tasks()
+                purged = purge_finished_tasks()
+                if requeued or purged:
+                    self.stdout.write(f"{requeued} takılı görev kuyruğa geri alındı, {purged} eski görev silindi.")
+                last_maintenance = now
+
+            tasks = claim_tasks(worker_id, options["batch"])
+            if not tasks:
+                if options["once"]:
+                    break
+                time.sleep(options["sleep"])
+                continue
+            for claimed in tasks:
+                if run_task(claimed):
+                    succeeded += 1
+                else:
+                    failed += 1
+                    self.stdout.write(self.style.WARNING(f"{claimed.name} #{claimed.pk} başarısız ({claimed.status})."))
+
+        self.stdout.write(self.style.SUCCESS(f"Worker durdu: {succeeded} görev tamamlandı, {failed} başarısız."))
+
+    def _stop(self, signum, frame):
+        # Finish the claimed batch, then leave the loop
+        self.stopping = True
@@ -4,7 +4,8 @@ from datetime import date
 
 from django.core.management.base import BaseCommand
 
-from events.models import Club, Event, Student, Tag
+from events.models import Club, Event, Student
+from events.tags import resolve_tags
 
 
 class Command(BaseCommand):
@@ -124,11 +125,7 @@ class Command(BaseCommand):
                 },
             )
             if created:
-                tags = [
-                    Tag.objects.get_or_create(name=tag.lower())[0]
-                    for tag in data.get("tags", [])
-                ]
-                event.tags.set(tags)
+                event.tags.set(resolve_tags(data.get("tags", [])))
                 event.save()
                 self.stdout.write(self.style.SUCCESS(f"{event.title} eklendi."))
             else:
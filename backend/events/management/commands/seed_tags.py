@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 
 from events.models import Tag
+from events.tags import normalize_tag_names, resolve_tags
 
 
 CURATED_TAGS = [
@@ -136,19 +137,16 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         dry = options.get("dry_run")
-        created = 0
-        for name in CURATED_TAGS:
-            name_norm = (name or "").strip().lower()
-            if not name_norm:
-                continue
-            obj, was_created = Tag.objects.get_or_create(name=name_norm)
-            if was_created:
-                created += 1
-                if dry:
-                    self.stdout.write(self.style.SUCCESS(f"[DRY] Would create: {name_norm}"))
-                else:
-                    self.stdout.write(self.style.SUCCESS(f"Created tag: {name_norm}"))
+        names = normalize_tag_names(CURATED_TAGS)
+        existing = set(Tag.objects.filter(name__in=names).values_list("name", flat=True))
+        missing = [name for name in names if name not in existing]
+        for name_norm in missing:
+            if dry:
+                self.stdout.write(self.style.SUCCESS(f"[DRY] Would create: {name_norm}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"Created tag: {name_norm}"))
         if dry:
             self.stdout.write(self.style.WARNING("Dry-run complete."))
         else:
-            self.stdout.write(self.style.SUCCESS(f"Seeding complete. {created} tags created."))
+            resolve_tags(missing)
+            self.stdout.write(self.style.SUCCESS(f"Seeding complete. {len(missing)} tags created."))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0005_event_description_alter_club_city"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="embedding",
+            field=models.BinaryField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0006_event_embedding"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StudentProfileVector",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "student",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="profile_vector",
+                        serialize=False,
+                        to="events.student",
+                    ),
+                ),
+                ("interest_vectors", models.BinaryField(blank=True, null=True)),
+                ("history_vectors", models.BinaryField(blank=True, null=True)),
+                ("history_event_ids", models.JSONField(blank=True, default=list)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
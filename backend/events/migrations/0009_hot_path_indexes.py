@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:10
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0008_event_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="club",
+            index=models.Index(
+                django.db.models.functions.text.Lower("university"),
+                django.db.models.functions.text.Lower("name"),
+                name="club_university_name_lower_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="participation",
+            index=models.Index(
+                fields=["event", "status", "created_at"], name="participation_event_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="student",
+            index=models.Index(
+                django.db.models.functions.text.Lower("email"), name="student_email_lower_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:14
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+TAG_TRIGRAM_INDEX = "tag_name_upper_trgm_idx"
+
+
+def fill_search_vectors(apps, schema_editor):
+    Club = apps.get_model("events", "Club")
+    Event = apps.get_model("events", "Event")
+    club_name = Subquery(Club.objects.filter(pk=OuterRef("club_id")).values("name")[:1])
+    Event.objects.update(
+        search_vector=SearchVector("title", weight="A", config="turkish")
+        + SearchVector("category", weight="B", config="turkish")
+        + SearchVector(club_name, weight="B", config="turkish")
+        + SearchVector("description", weight="C", config="turkish")
+    )
+
+
+def create_tag_trigram_index(apps, schema_editor):
+    # Matches the UPPER(name::text) LIKE UPPER('%q%') that name__icontains
+    # compiles to. Skipped where the pg_trgm extension is not installable.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {TAG_TRIGRAM_INDEX} "
+            "ON events_tag USING gin (UPPER(name::text) gin_trgm_ops)"
+        )
+
+
+def drop_tag_trigram_index(apps, schema_editor):
+    schema_editor.execute(f"DROP INDEX IF EXISTS {TAG_TRIGRAM_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0009_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="event_search_vector_idx"
+            ),
+        ),
+        migrations.RunPython(fill_search_vectors, migrations.RunPython.noop),
+        migrations.RunPython(create_tag_trigram_index, drop_tag_trigram_index),
+    ]
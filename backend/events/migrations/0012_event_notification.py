@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0011_task_queue"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventNotification",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("subject", models.CharField(max_length=255)),
+                ("body", models.TextField(blank=True, default="")),
+                ("status", models.CharField(choices=[("queued", "Kuyrukta"), ("sending", "Gönderiliyor"), ("sent", "Gönderildi"), ("failed", "Başarısız")], default="queued", max_length=20)),
+                ("recipient_count", models.PositiveIntegerField(default=0)),
+                ("sent_count", models.PositiveIntegerField(default=0)),
+                ("failed_count", models.PositiveIntegerField(default=0)),
+                ("cursor", models.CharField(blank=True, default="", max_length=254)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("event", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="notifications", to="events.event")),
+            ],
+            options={
+                "ordering": ("-created_at",),
+            },
+        ),
+    ]
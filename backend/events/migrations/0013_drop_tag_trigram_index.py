@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:05
+
+from importlib import import_module
+
+from django.db import migrations
+
+# The tag typeahead is answered from the in-process tag dictionary
+# (events/tags.py), so nothing queries UPPER(name) any more.
+event_search = import_module("events.migrations.0010_event_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0012_event_notification"),
+    ]
+
+    operations = [
+        migrations.RunPython(event_search.drop_tag_trigram_index, event_search.create_tag_trigram_index),
+    ]
@@ -1,7 +1,12 @@
 """Database models for UniConnect."""
 
-from django.contrib.auth.hashers import check_password, make_password
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from .passwords import hash_password, verify_password
 
 
 class TimeStampedModel(models.Model):
@@ -20,14 +25,24 @@ class Club(TimeStampedModel):
     email = models.EmailField(blank=True)
     password = models.CharField(max_length=128)
 
+    class Meta:
+        indexes = [
+            # ClubLoginView: LOWER(university) = ... AND LOWER(name) = ...
+            models.Index(Lower("university"), Lower("name"), name="club_university_name_lower_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.university} - {self.name}"
 
+    # request.user protocol for events.authentication
+    is_authenticated = True
+    is_anonymous = False
+
     def set_password(self, raw_password: str) -> None:
-        self.password = make_password(raw_password)
+        self.password = hash_password(raw_password)
 
     def check_password(self, raw_password: str) -> bool:
-        return check_password(raw_password, self.password)
+        return verify_password(self, raw_password)
 
 
 class Tag(TimeStampedModel):
@@ -52,14 +67,40 @@ class Student(TimeStampedModel):
         Tag, related_name="interested_students", blank=True
     )
 
+    class Meta:
+        indexes = [
+            # StudentLoginView: LOWER(email) = ...
+            models.Index(Lower("email"), name="student_email_lower_idx"),
+        ]
+
     def __str__(self) -> str:
         return self.username
 
+    # request.user protocol for events.authentication
+    is_authenticated = True
+    is_anonymous = False
+
     def set_password(self, raw_password: str) -> None:
-        self.password = make_password(raw_password)
+        self.password = hash_password(raw_password)
 
     def check_password(self, raw_password: str) -> bool:
-        return check_password(raw_password, self.password)
+        return verify_password(self, raw_password)
+
+
+class StudentProfileVector(TimeStampedModel):
+    """Precomputed recommendation profile of a student; see embeddings.py."""
+
+    student = models.OneToOneField(
+        Student, related_name="profile_vector", on_delete=models.CASCADE, primary_key=True
+    )
+    # Normalized float32 matrices in .npy format
+    interest_vectors = models.BinaryField(null=True, blank=True)
+    history_vectors = models.BinaryField(null=True, blank=True)
+    # Event id of each history_vectors row, in row order
+    history_event_ids = models.JSONField(default=list, blank=True)
+
+    def __str__(self) -> str:
+        return f"{self.student_id} profile vectors"
 
 
 class Event(TimeStampedModel):
@@ -75,9 +116,21 @@ class Event(TimeStampedModel):
     participants_count = models.PositiveIntegerField(default=0)
     waiting_list_count = models.PositiveIntegerField(default=0)
     tags = models.ManyToManyField(Tag, related_name="events", blank=True)
+    # FastText vector of "title description", float32 bytes; see embeddings.py
+    embedding = models.BinaryField(null=True, blank=True)
+    # Weighted turkish tsvector of title, category, club name, description; see search.py
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         ordering = ("date",)
+        indexes = [
+            GinIndex(fields=["search_vector"], name="event_search_vector_idx"),
+            # Keyset pagination and the list filters (see pagination.py, filters.py)
+            models.Index(fields=["date", "id"], name="event_date_id_idx"),
+            models.Index(fields=["city", "date"], name="event_city_date_idx"),
+            models.Index(fields=["university", "date"], name="event_university_date_idx"),
+            models.Index(fields=["category", "date"], name="event_category_date_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} ({self.club.name})"
@@ -108,6 +161,10 @@ class Participation(TimeStampedModel):
     class Meta:
         unique_together = ("student", "event")
         ordering = ("-created_at",)
+        indexes = [
+            # Waitlist promotion and positions (participation_service.py)
+            models.Index(fields=["event", "status", "created_at"], name="participation_event_status_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.student.username} -> {self.event.title} ({self.status})"
@@ -127,3 +184,78 @@ class Favorite(TimeStampedModel):
 
     def __str__(self) -> str:
         return f"{self.student.username} ♥ {self.event.title}"
+
+
+class EventNotification(TimeStampedModel):
+    """One club mailing to the confirmed participants of an event; see notifications.py."""
+
+    STATUS_QUEUED = "queued"
+    STATUS_SENDING = "sending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "Kuyrukta"),
+        (STATUS_SENDING, "Gönderiliyor"),
+        (STATUS_SENT, "Gönderildi"),
+        (STATUS_FAILED, "Başarısız"),
+    ]
+
+    event = models.ForeignKey(Event, related_name="notifications", on_delete=models.CASCADE)
+    subject = models.CharField(max_length=255)
+    body = models.TextField(blank=True, default="")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    # Recipients at enqueue time; participants may still change while sending
+    recipient_count = models.PositiveIntegerField(default=0)
+    sent_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0)
+    # Last e-mail handed to the backend; a retried send resumes after it
+    cursor = models.CharField(max_length=254, blank=True, default="")
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        ordering = ("-created_at",)
+
+    def __str__(self) -> str:
+        return f"{self.event_id}: {self.subject} ({self.status})"
+
+
+class Task(TimeStampedModel):
+    """Background job in the database-backed queue; see task_queue.py."""
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Bekliyor"),
+        (STATUS_RUNNING, "Çalışıyor"),
+        (STATUS_SUCCEEDED, "Tamamlandı"),
+        (STATUS_FAILED, "Başarısız"),
+    ]
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    # Earliest time a worker may claim the task; moved forward on retry
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=255, blank=True, default="")
+    locked_at = models.DateTimeField(null=True, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Wall time of the last attempt
+    duration_ms = models.PositiveIntegerField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        ordering = ("run_at", "id")
+        indexes = [
+            # Worker claim: status = 'pending' AND run_at <= now ORDER BY run_at, id
+            models.Index(fields=["status", "run_at", "id"], name="task_status_run_at_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.name} #{self.pk} ({self.status})"
@@ -0,0 +1,130 @@
+"""Mail fan-out for club notifications to event participants.
+
+``EventViewSet.notify_participants`` stores an ``EventNotification`` and
+queues a ``notify_participants`` task; the worker calls
+``send_notification``. Recipients are streamed from the database in e-mail
+order with ``.iterator(chunk_size=...)`` and handed to one reused backend
+connection ``NOTIFICATION_BATCH_SIZE`` messages at a time, so memory and SMTP
+handshakes do not grow with the event size.
+
+Progress (sent/failed counts and the last e-mail handed over) is written
+after every batch. If the worker dies or the connection cannot be opened, the
+retried task continues after ``cursor`` instead of mailing everyone again.
+A batch the backend rejects is counted as failed and sending goes on with a
+fresh connection.
+"""
+
+import logging
+from itertools import islice
+from typing import Iterator, List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import F
+from django.utils import timezone
+
+from .models import EventNotification, Participation
+
+logger = logging.getLogger(__name__)
+
+
+def confirmed_recipients(event_id: int, after: str = ""):
+    """Confirmed participants' e-mails in e-mail order, starting after ``after``."""
+    queryset = Participation.objects.filter(
+        event_id=event_id, status=Participation.STATUS_CONFIRMED
+    ).exclude(student__email="")
+    if after:
+        queryset = queryset.filter(student__email__gt=after)
+    return queryset.order_by("student__email").values_list("student__email", flat=True)
+
+
+def create_notification(event, subject: str, body: str) -> EventNotification:
+    """Store the mailing with its recipient count; sending is up to the worker."""
+    return EventNotification.objects.create(
+        event=event,
+        subject=subject,
+        body=body,
+        recipient_count=confirmed_recipients(event.pk).count(),
+    )
+
+
+def _batches(emails: Iterator[str], size: int) -> Iterator[List[str]]:
+    while True:
+        batch = list(islice(emails, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _messages(notification: EventNotification, emails: List[str]) -> List[EmailMessage]:
+    # One message per recipient: participants never see each other's address
+    return [
+        EmailMessage(
+            subject=notification.subject,
+            body=notification.body,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[email],
+        )
+        for email in emails
+    ]
+
+
+def send_notification(notification_id: int, batch_size: Optional[int] = None) -> Optional[EventNotification]:
+    """Send (or resume) one notification; returns it with the final counters.
+
+    Raises when no connection can be opened, so the task queue retries later.
+    """
+    notification = EventNotification.objects.filter(pk=notification_id).first()
+    if notification is None or notification.status in (EventNotification.STATUS_SENT, EventNotification.STATUS_FAILED):
+        return notification
+    batch_size = batch_size or getattr(settings, "NOTIFICATION_BATCH_SIZE", 100)
+
+    progress = EventNotification.objects.filter(pk=notification.pk)
+    progress.update(
+        status=EventNotification.STATUS_SENDING,
+        started_at=notification.started_at or timezone.now(),
+    )
+
+    connection = get_connection(fail_silently=False)
+    connection.open()
+    try:
+        emails = confirmed_recipients(notification.event_id, after=notification.cursor).iterator(
+            chunk_size=batch_size
+        )
+        for batch in _batches(emails, batch_size):
+            sent, error = 0, ""
+            try:
+                sent = connection.send_messages(_messages(notification, batch)) or 0
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+                logger.warning("Bildirim %s: %d alıcılık grup gönderilemedi: %s", notification.pk, len(batch), error)
+                # A broken SMTP session would fail every following batch too
+                connection.close()
+                connection.open()
+            updates = {
+                "sent_count": F("sent_count") + sent,
+                "failed_count": F("failed_count") + len(batch) - sent,
+                "cursor": batch[-1],
+            }
+            if error:
+                updates["last_error"] = error
+            progress.update(**updates)
+    finally:
+        connection.close()
+
+    notification.refresh_from_db()
+    notification.status = (
+        EventNotification.STATUS_FAILED
+        if notification.failed_count and not notification.sent_count
+        else EventNotification.STATUS_SENT
+    )
+    notification.finished_at = timezone.now()
+    notification.save(update_fields=["status", "finished_at", "updated_at"])
+    logger.info(
+        "Bildirim %s (etkinlik %s): %d gönderildi, %d başarısız.",
+        notification.pk,
+        notification.event_id,
+        notification.sent_count,
+        notification.failed_count,
+    )
+    return notification
@@ -0,0 +1,123 @@
+"""Pagination classes for the event endpoints."""
+
+import base64
+from datetime import date
+from urllib.parse import parse_qs, urlencode
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class EventKeysetPagination(BasePagination):
+    """
+    Cursor pagination on ``(date, id)``.
+
+    A page is ``WHERE (date, id) > (last_date, last_id) ORDER BY date, id
+    LIMIT n``, answered from the ``(date, id)`` index, so deep pages cost the
+    same as the first one. The opaque cursor stores the boundary row and the
+    direction; ``previous`` walks backwards with the inverted comparison.
+    Response shape matches DRF's ``CursorPagination``.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    invalid_cursor_message = "Geçersiz sayfa imleci."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        cursor = self.decode_cursor(request)
+        self.has_cursor = cursor is not None
+        self.reverse = bool(cursor and cursor["reverse"])
+
+        if cursor is not None:
+            boundary_date, boundary_id = cursor["date"], cursor["id"]
+            if self.reverse:
+                queryset = queryset.filter(date__lte=boundary_date).filter(
+                    Q(date__lt=boundary_date) | Q(id__lt=boundary_id)
+                )
+            else:
+                queryset = queryset.filter(date__gte=boundary_date).filter(
+                    Q(date__gt=boundary_date) | Q(id__gt=boundary_id)
+                )
+        ordering = ("-date", "-id") if self.reverse else ("date", "id")
+        rows = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        self.has_more = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        if self.reverse:
+            self.page.reverse()
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            querystring = base64.b64decode(encoded.encode("ascii")).decode("ascii")
+            tokens = parse_qs(querystring, keep_blank_values=True)
+            return {
+                "date": date.fromisoformat(tokens["d"][0]),
+                "id": int(tokens["i"][0]),
+                "reverse": bool(int(tokens.get("r", ["0"])[0])),
+            }
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, event, reverse: bool) -> str:
+        querystring = urlencode({"d": event.date.isoformat(), "i": event.pk, "r": int(reverse)})
+        encoded = base64.b64encode(querystring.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.page:
+            return None
+        # Walking backwards, the rows after this page are the ones we came from
+        if self.has_more or self.reverse:
+            return self.encode_cursor(self.page[-1], reverse=False)
+        return None
+
+    def get_previous_link(self):
+        if not self.page:
+            return None
+        if (self.reverse and self.has_more) or (not self.reverse and self.has_cursor):
+            return self.encode_cursor(self.page[0], reverse=True)
+        return None
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class EventSearchPagination(PageNumberPagination):
+    """Search results are ordered by rank, not (date, id), so they page by number."""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
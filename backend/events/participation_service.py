@@ -0,0 +1,131 @@
+"""
+Capacity-safe participation changes for events.
+
+Every change that reads and writes an event's counters runs in one
+transaction holding a row lock on the event (``SELECT ... FOR UPDATE``).
+Concurrent joins for the same event are therefore serialized: the capacity
+check always sees the counters written by the previous join, so the event is
+never overbooked and no increment is lost. Joins for different events do not
+block each other.
+
+Waitlist positions are not stored; ``waiting_positions`` derives them for
+any number of events with one ``ROW_NUMBER()`` window query.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from .models import Event, Participation, Student
+
+COUNTER_FIELDS = ["participants_count", "waiting_list_count", "updated_at"]
+
+
+def _lock_event(event_id: int) -> Event:
+    return (
+        Event.objects.select_for_update()
+        .only("id", "capacity", "participants_count", "waiting_list_count")
+        .get(pk=event_id)
+    )
+
+
+def _copy_counters(source: Event, target: Event) -> None:
+    target.participants_count = source.participants_count
+    target.waiting_list_count = source.waiting_list_count
+
+
+def join_event(event: Event, student: Student) -> Tuple[Participation, bool]:
+    """Confirm or waitlist ``student`` for ``event``; returns (participation, created).
+
+    ``event`` gets the counters as committed, ready to be serialized.
+    """
+    with transaction.atomic():
+        locked = _lock_event(event.pk)
+        participation = Participation.objects.filter(student=student, event_id=event.pk).first()
+        created = participation is None
+        if created:
+            if locked.is_full:
+                status = Participation.STATUS_WAITLISTED
+                locked.waiting_list_count += 1
+            else:
+                status = Participation.STATUS_CONFIRMED
+                locked.participants_count += 1
+            participation = Participation.objects.create(student=student, event=event, status=status)
+            locked.save(update_fields=COUNTER_FIELDS)
+
+    _copy_counters(locked, event)
+    return participation, created
+
+
+def _promote_waitlisted(locked: Event) -> List[Participation]:
+    """Confirm the oldest waitlisted participants while there are free seats."""
+    promoted = []
+    while not locked.is_full and locked.waiting_list_count > 0:
+        participation = (
+            Participation.objects.select_for_update()
+            .filter(event_id=locked.pk, status=Participation.STATUS_WAITLISTED)
+            .order_by("created_at", "id")
+            .first()
+        )
+        if participation is None:
+            # Counter drifted from the rows; trust the rows
+            locked.waiting_list_count = 0
+            break
+        participation.status = Participation.STATUS_CONFIRMED
+        participation.save(update_fields=["status", "updated_at"])
+        locked.participants_count += 1
+        locked.waiting_list_count -= 1
+        promoted.append(participation)
+    return promoted
+
+
+def cancel_participation(
+    event: Event, student: Student
+) -> Tuple[Optional[Participation], List[Participation]]:
+    """Remove ``student`` from ``event`` and fill the freed seat from the waitlist.
+
+    Returns the deleted participation (None if there was none) and the
+    participations promoted from the waitlist.
+    """
+    with transaction.atomic():
+        locked = _lock_event(event.pk)
+        participation = Participation.objects.filter(student=student, event_id=event.pk).first()
+        if participation is None:
+            _copy_counters(locked, event)
+            return None, []
+
+        participation.delete()
+        if participation.status == Participation.STATUS_CONFIRMED:
+            locked.participants_count = max(locked.participants_count - 1, 0)
+        else:
+            locked.waiting_list_count = max(locked.waiting_list_count - 1, 0)
+        promoted = _promote_waitlisted(locked)
+        locked.save(update_fields=COUNTER_FIELDS)
+
+    _copy_counters(locked, event)
+    return participation, promoted
+
+
+def waiting_positions_queryset(event_ids: Iterable[int]):
+    """``(participation id, position)`` rows for the waitlists of ``event_ids``."""
+    return (
+        Participation.objects.filter(event_id__in=event_ids, status=Participation.STATUS_WAITLISTED)
+        .annotate(
+            position=Window(
+                RowNumber(),
+                partition_by=[F("event_id")],
+                order_by=[F("created_at").asc(), F("id").asc()],
+            )
+        )
+        .values_list("id", "position")
+    )
+
+
+def waiting_positions(event_ids: Iterable[int]) -> Dict[int, int]:
+    """Participation id -> 1-based waitlist position, for every waitlisted row of ``event_ids``."""
+    event_ids = set(event_ids)
+    if not event_ids:
+        return {}
+    return dict(waiting_positions_queryset(event_ids))
@@ -0,0 +1,54 @@
+"""Password hashing policy for students and clubs.
+
+``PASSWORD_HASHER`` in settings picks the hasher new passwords are stored
+with: ``argon2`` (``TunedArgon2PasswordHasher``, needs argon2-cffi) or
+``pbkdf2`` (Django's default). Older hashes keep working; ``verify_password``
+re-hashes them with the current policy on the next successful login, which
+also applies changed Argon2 cost parameters.
+
+Both argon2-cffi and hashlib's PBKDF2 release the GIL while hashing, so with
+gunicorn's ``gthread`` workers a login only occupies its own thread. The
+semaphore caps concurrent hash computations per process
+(``PASSWORD_HASH_CONCURRENCY``) so a burst of logins cannot take every core
+and, with Argon2, ``memory_cost`` KiB per hash, away from other requests.
+"""
+
+import threading
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, check_password, make_password
+
+_hash_slots = threading.BoundedSemaphore(getattr(settings, "PASSWORD_HASH_CONCURRENCY", 2))
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id with cost parameters from settings instead of Django's fixed ones.
+
+    Same ``algorithm`` name as Django's hasher, so existing argon2 hashes are
+    verified by this class and upgraded when the parameters differ.
+    """
+
+    time_cost = getattr(settings, "ARGON2_TIME_COST", 2)
+    memory_cost = getattr(settings, "ARGON2_MEMORY_COST", 19456)
+    parallelism = getattr(settings, "ARGON2_PARALLELISM", 1)
+
+
+def hash_password(raw_password: str) -> str:
+    """``make_password`` under the per-process hashing limit."""
+    with _hash_slots:
+        return make_password(raw_password)
+
+
+def verify_password(instance, raw_password: str) -> bool:
+    """Check ``raw_password`` against ``instance.password``, upgrading stale hashes.
+
+    ``instance`` is a ``Student`` or ``Club``. The upgraded hash is written
+    with a single-column UPDATE so no other field of the row is touched.
+    """
+    outdated = []
+    with _hash_slots:
+        valid = check_password(raw_password, instance.password, outdated.append)
+    if outdated:
+        instance.password = hash_password(raw_password)
+        type(instance).objects.filter(pk=instance.pk).update(password=instance.password)
+    return valid
@@ -0,0 +1,150 @@
+"""Database side of the recommendation pipeline.
+
+``recommendation_service`` only knows about texts and vectors; this module
+turns a student and the upcoming events into ranked recommendations. Both
+``RecommendationView`` and ``StudentProfileView`` go through
+``recommend_for_student``.
+
+Candidates are streamed as plain rows (id, title, description, tag overlap,
+stored vector), scored chunk by chunk and reduced into a bounded top-k heap,
+so peak memory depends on the chunk size and ``top_k`` rather than on the
+size of the event table. Only the winners are loaded as model instances. The student side is the
+precomputed profile matrix from ``embeddings.student_profile_matrix``.
+Above ``RECOMMENDATION_ANN_MIN_EVENTS`` upcoming events the stream is first
+narrowed by the ANN index in ``ann_index``.
+"""
+
+import heapq
+from itertools import islice
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Count, IntegerField, Q, Value
+from django.utils import timezone
+
+from .ann_index import event_vector_index
+from .embeddings import student_profile_matrix
+from .models import Event, Tag
+from .recommendation_service import (
+    embedding_from_bytes,
+    get_recommender,
+    rank_scores,
+    recommendation_cache,
+)
+
+CHUNK_SIZE = 2000
+
+
+def candidate_queryset(tag_ids: Iterable[int], today):
+    """Upcoming events annotated with ``tag_overlap`` computed in SQL.
+
+    The overlap is a filtered ``COUNT`` over the tag join, so assembling the
+    candidates costs one query no matter how many events there are.
+    """
+    tag_ids = list(tag_ids)
+    queryset = Event.objects.filter(date__gte=today)
+    if tag_ids:
+        overlap = Count("tags", filter=Q(tags__in=tag_ids), distinct=True)
+    else:
+        overlap = Value(0, output_field=IntegerField())
+    return queryset.annotate(tag_overlap=overlap).order_by("date", "id")
+
+
+def student_tag_ids(student) -> List[int]:
+    """Ids of the student's interest tags and of the tags of events they joined."""
+    tag_ids = set(student.interests.values_list("id", flat=True))
+    tag_ids.update(
+        Tag.objects.filter(events__participations__student=student).values_list("id", flat=True)
+    )
+    return list(tag_ids)
+
+
+def recall_candidates(interest_matrix, tag_ids: List[int], today) -> Optional[List[int]]:
+    """ANN first stage for large catalogs; None means "score every event".
+
+    Besides the nearest neighbours of the interest vectors, events with any
+    tag overlap (up to +0.3) and events without a stored vector (tag-only
+    score) are always kept, so the exact rescoring still sees them.
+    """
+    upcoming = Event.objects.filter(date__gte=today)
+    # Count first: building or syncing the index only pays off on large catalogs
+    vectors = upcoming.filter(embedding__isnull=False).count()
+    if vectors < getattr(settings, "RECOMMENDATION_ANN_MIN_EVENTS", 15000):
+        return None
+
+    index = event_vector_index.get(today)
+    recalled = set(index.search(interest_matrix, getattr(settings, "RECOMMENDATION_ANN_RECALL", 500)))
+    if tag_ids:
+        recalled.update(upcoming.filter(tags__in=tag_ids).values_list("id", flat=True))
+    recalled.update(upcoming.filter(embedding__isnull=True).values_list("id", flat=True))
+    return list(recalled)
+
+
+def score_student(student, top_k: int, today, chunk_size: int = CHUNK_SIZE) -> Optional[List[Tuple[int, float]]]:
+    """Rank upcoming events for ``student``; None when the profile is empty."""
+    tag_ids = student_tag_ids(student)
+    if not tag_ids and not student.participations.exists():
+        return None
+
+    recommender = get_recommender()
+    # Precomputed interest + past event vectors, see embeddings.py
+    interest_matrix = student_profile_matrix(student.pk)
+
+    queryset = candidate_queryset(tag_ids, today)
+    if interest_matrix is not None and interest_matrix.size:
+        recalled = recall_candidates(interest_matrix, tag_ids, today)
+        if recalled is not None:
+            queryset = queryset.filter(id__in=recalled)
+
+    rows = (
+        queryset
+        .values_list("id", "title", "description", "tag_overlap", "embedding")
+        .iterator(chunk_size=chunk_size)
+    )
+
+    # Min-heap of (score, -position, event_id): ties keep stream order, like
+    # the stable sort in rank_scores.
+    heap = []
+    position = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        candidates = []
+        embeddings = {}
+        for event_id, title, description, tag_overlap, raw in chunk:
+            candidates.append((event_id, title, description, tag_overlap))
+            vector = embedding_from_bytes(raw)
+            if vector is not None:
+                embeddings[event_id] = vector
+
+        scores = recommender.score_candidates(candidates, interest_matrix, embeddings)
+        positions = {event_id: position + i for i, (event_id, *_) in enumerate(candidates)}
+        for event_id, score in rank_scores([c[0] for c in candidates], scores, top_k):
+            item = (score, -positions[event_id], event_id)
+            if len(heap) < top_k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+        position += len(candidates)
+
+    return [(event_id, score) for score, _, event_id in sorted(heap, reverse=True)]
+
+
+def recommend_for_student(student, top_k: int) -> Optional[List[Tuple[int, float]]]:
+    """Cached ranked ``(event_id, score)`` list for ``student``."""
+    today = timezone.localdate()
+    return recommendation_cache.get_or_compute(
+        student.pk, top_k, today, lambda: score_student(student, top_k, today)
+    )
+
+
+def load_ranked_events(event_scores: List[Tuple[int, float]]) -> List[Event]:
+    """Fetch the winning events, ready for ``EventSerializer``, in rank order."""
+    event_ids = [event_id for event_id, _ in event_scores]
+    events = (
+        Event.objects.select_related("club")
+        .prefetch_related("tags")
+        .in_bulk(event_ids)
+    )
+    return [events[event_id] for event_id in event_ids if event_id in events]
@@ -5,13 +5,192 @@ Bu modül, Türkçe FastText modeli kullanarak etkinlik önerileri sunar.
 Öğrenci ilgi alanları ve etkinlik açıklamalarının semantik benzerliğini hesaplar.
 """
 
+import io
 import logging
-from typing import List, Tuple
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import numpy as np
 from django.core.cache import cache
 
+from .cache_versions import bump_version, get_version
+
 logger = logging.getLogger(__name__)
 
+EMBEDDING_DTYPE = np.float32
+
+
+def event_text(title: str, description: str) -> str:
+    """Etkinliğin embedding'e giren metni: başlık + açıklama."""
+    return f"{title} {description}"
+
+
+def embedding_to_bytes(vec: Optional[np.ndarray]) -> Optional[bytes]:
+    """Vektörü veritabanında saklanacak float32 byte dizisine çevirir."""
+    if vec is None:
+        return None
+    return np.asarray(vec, dtype=EMBEDDING_DTYPE).tobytes()
+
+
+def matrix_to_bytes(matrix: np.ndarray) -> bytes:
+    """(n, d) matrisi şekliyle birlikte saklanacak .npy byte dizisine çevirir."""
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(matrix, dtype=EMBEDDING_DTYPE), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def matrix_from_bytes(raw) -> np.ndarray:
+    """``matrix_to_bytes`` ile saklanan matrisi okur; boşsa (0, 0) döner."""
+    if not raw:
+        return np.zeros((0, 0), dtype=EMBEDDING_DTYPE)
+    return np.load(io.BytesIO(bytes(raw)), allow_pickle=False)
+
+
+def embedding_from_bytes(raw) -> Optional[np.ndarray]:
+    """Veritabanından okunan byte dizisini (bytes/memoryview) vektöre çevirir."""
+    if not raw:
+        return None
+    return np.frombuffer(bytes(raw), dtype=EMBEDDING_DTYPE)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Satırları L2-normalize eder; sıfır normlu satırlar sıfır kalır."""
+    matrix = np.asarray(matrix, dtype=EMBEDDING_DTYPE)
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+    norms[norms == 0] = 1.0
+    return matrix / norms[:, None]
+
+
+def stack_vectors(vectors: List[Optional[np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Vektörleri normalize edilmiş (n, d) matrise dizer.
+
+    Returns:
+        (matris, has_vector) — vektörü olmayan (None) satırlar sıfırdır ve
+        maskede False olarak işaretlenir.
+    """
+    dim = next((len(vec) for vec in vectors if vec is not None), 0)
+    matrix = np.zeros((len(vectors), dim), dtype=EMBEDDING_DTYPE)
+    has_vector = np.zeros(len(vectors), dtype=bool)
+    for row, vec in enumerate(vectors):
+        if vec is not None:
+            matrix[row] = vec
+            has_vector[row] = True
+    return normalize_rows(matrix), has_vector
+
+
+def score_batch(
+    event_matrix: np.ndarray,
+    interest_matrix: np.ndarray,
+    tag_overlaps,
+    has_vector: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Bir aday kümesinin tamamını tek matris çarpımıyla skorlar.
+
+    Skor formülü eski etkinlik-başına döngüyle aynıdır:
+    ``max(0, max cosine) * 0.7 + min(tag_overlap * 0.05, 0.3)``; vektörü
+    olmayan etkinlikler için ``tag_overlap * 0.1``.
+
+    Args:
+        event_matrix: (n, d) normalize etkinlik vektörleri
+        interest_matrix: (m, d) normalize ilgi alanı vektörleri
+        tag_overlaps: n uzunluğunda tag eşleşme sayıları
+        has_vector: Hangi satırların vektörü olduğu (None ise hepsi)
+
+    Returns:
+        (n,) skor dizisi
+    """
+    tags = np.asarray(tag_overlaps, dtype=np.float64)
+    if has_vector is None:
+        has_vector = np.ones(len(tags), dtype=bool)
+
+    max_similarity = np.zeros(len(tags), dtype=np.float64)
+    if interest_matrix.size and event_matrix.size:
+        similarities = event_matrix @ interest_matrix.T
+        max_similarity = np.maximum(similarities.max(axis=1), 0.0)
+
+    scores = max_similarity * 0.7 + np.minimum(tags * 0.05, 0.3)
+    return np.where(has_vector, scores, tags * 0.1)
+
+
+def rank_scores(event_ids: List[int], scores: np.ndarray, top_k: int) -> List[Tuple[int, float]]:
+    """Skora göre azalan, eşitlikte giriş sırasını koruyan top_k listesi."""
+    if len(scores) > top_k > 0:
+        # Sadece k. en yüksek skora eşit/büyük olanları sırala (eşitlikler dahil)
+        threshold = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+        candidates = np.flatnonzero(scores >= threshold)
+        order = candidates[np.argsort(-scores[candidates], kind="stable")][:top_k]
+    else:
+        order = np.argsort(-scores, kind="stable")[:top_k]
+    return [(event_ids[i], float(scores[i])) for i in order]
+
+
+class WordVectorCache:
+    """
+    Kelime -> FastText vektörü için süreç içi, sınırlı boyutlu LRU cache.
+
+    Etkinlik metinleri aynı kelimeleri tekrar tekrar kullandığından
+    ``get_word_vector`` sonuçları tüm recommender çağrıları arasında
+    paylaşılır. Vektörü alınamayan kelimeler de (None olarak) saklanır.
+    ``maxsize=0`` cache'i kapatır.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Optional[np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(
+        self, words: Iterable[str], compute: Callable[[str], Optional[np.ndarray]]
+    ) -> Dict[str, Optional[np.ndarray]]:
+        """Kelimelerin vektörlerini döndürür; cache'te olmayanlar ``compute`` ile hesaplanır."""
+        found = {}
+        missing = []
+        with self._lock:
+            for word in words:
+                vec = self._entries.get(word, self._MISSING)
+                if vec is self._MISSING:
+                    missing.append(word)
+                else:
+                    self._entries.move_to_end(word)
+                    found[word] = vec
+            self.hits += len(found)
+            self.misses += len(missing)
+
+        # Model çağrıları kilit dışında
+        computed = {word: compute(word) for word in missing}
+        found.update(computed)
+
+        if self.maxsize > 0 and computed:
+            with self._lock:
+                self._entries.update(computed)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return found
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Bu süreçteki kelime bazında hit/miss sayaçları ve doluluk."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
 
 class TurkishFastTextRecommender:
     """Türkçe FastText modeli kullanarak etkinlik önerileri."""
@@ -19,8 +198,58 @@ class TurkishFastTextRecommender:
     def __init__(self):
         self.model = None
         self.model_loaded = False
+        self.load_attempted = False
+        self._load_lock = threading.Lock()
+        self._loader: Optional[threading.Thread] = None
+        self.word_cache = WordVectorCache(self._word_cache_size())
+    
+    @staticmethod
+    def _word_cache_size() -> int:
+        from django.conf import settings
+        
+        return getattr(settings, "FASTTEXT_WORD_CACHE_SIZE", 20000)
+    
+    @staticmethod
+    def fasttext_enabled() -> bool:
+        return os.getenv('FASTTEXT_ENABLED', 'false').lower() == 'true'
+    
+    @property
+    def is_ready(self) -> bool:
+        """Model yüklendi, yükleme denendi (tag-based moda düşüldü) ya da
+        FastText kapalı olduğu için beklenecek bir model yok mu?"""
+        return self.model_loaded or self.load_attempted or not self.fasttext_enabled()
+    
+    def preload(self) -> None:
+        """Modeli istek gelmeden yükler (gunicorn master'da fork öncesi)."""
+        self._load_model()
+    
+    def start_loading(self) -> None:
+        """Preload kapalıyken modeli arka plan thread'inde yüklemeye başlar.
+        
+        Gunicorn ``post_fork`` ve readiness probe'u çağırır; worker model
+        yüklenince hazır olur, ilk öneri isteği yüklemeyi beklemez.
+        """
+        if self.load_attempted or not self.fasttext_enabled():
+            return
+        with self._load_lock:
+            if self._loader is not None or self.load_attempted:
+                return
+            self._loader = threading.Thread(target=self._load_model, name="fasttext-loader", daemon=True)
+        self._loader.start()
         
     def _load_model(self):
+        """Modeli thread-safe şekilde, süreç başına bir kez yükler."""
+        if self.model_loaded:
+            return
+        with self._load_lock:
+            if self.model_loaded:
+                return
+            try:
+                self._load_model_unlocked()
+            finally:
+                self.load_attempted = True
+        
+    def _load_model_unlocked(self):
         """
         Türkçe FastText modelini yükler.
         
@@ -31,6 +260,10 @@ class TurkishFastTextRecommender:
         
         2. Gensim ile FastText kullanımı (özel eğitim için)
         
+        3. Budanmış vektör dosyası (FASTTEXT_VECTORS_PATH, varsa öncelikli):
+           ``export_fasttext_vectors`` komutuyla üretilir ve mmap ile açılır,
+           böylece worker'lar tek bir page-cache kopyasını paylaşır
+        
         Render deployment için:
         - Model otomatik indirilir (build.sh)
         - FASTTEXT_ENABLED=false ise model yüklenmez
@@ -39,19 +272,26 @@ class TurkishFastTextRecommender:
             return
         
         # FASTTEXT_ENABLED kontrolü (Render için)
-        import os
-        fasttext_enabled = os.getenv('FASTTEXT_ENABLED', 'false').lower() == 'true'
-        
-        if not fasttext_enabled:
+        if not self.fasttext_enabled():
             logger.info("FASTTEXT_ENABLED=false, tag-based sistem kullanılacak")
             self.model_loaded = False
             return
             
         try:
-            import fasttext
-            import os
             from django.conf import settings
             
+            # Budanmış float16 vektörler (mmap) varsa tam modeli hiç yükleme
+            vectors_path = getattr(settings, 'FASTTEXT_VECTORS_PATH', None)
+            if vectors_path and os.path.exists(vectors_path):
+                from .fasttext_vectors import PrunedFastTextVectors
+                
+                logger.info(f"Budanmış FastText vektörleri yükleniyor: {vectors_path}")
+                self.model = PrunedFastTextVectors.load(vectors_path)
+                self.model_loaded = True
+                return
+            
+            import fasttext
+            
             # Model dosyası yolu
             model_path = getattr(settings, 'FASTTEXT_MODEL_PATH', None)
             
@@ -99,73 +339,76 @@ class TurkishFastTextRecommender:
         
         return text
     
+    def _word_vector(self, word: str) -> Optional[np.ndarray]:
+        """Tek kelimenin vektörü; alınamazsa None (kelime atlanır)."""
+        try:
+            vec = np.asarray(self.model.get_word_vector(word), dtype=EMBEDDING_DTYPE)
+        except:
+            return None
+        # Cache'teki dizi paylaşılıyor, yanlışlıkla değiştirilmesin
+        vec.setflags(write=False)
+        return vec
+    
     def _get_text_embedding(self, text: str) -> np.ndarray:
         """Metni FastText ile vektöre çevirir."""
-        if not self.model:
-            return None
+        return self._embed_texts([text])[0]
+    
+    def _embed_texts(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Birden çok metni tek seferde vektöre çevirir.
         
-        text = self._preprocess_turkish_text(text)
-        if not text:
-            return None
+        Metinlerdeki kelimeler önce tekilleştirilir, her farklı kelimenin
+        vektörü (``word_cache`` üzerinden) bir kez alınır; her metnin vektörü
+        kelime vektörlerinin ortalamasıdır.
+        """
+        if not self.model:
+            return [None] * len(texts)
         
         try:
-            # FastText ile cümle embedding'i
-            words = text.split()
-            if not words:
-                return None
+            token_lists = [self._preprocess_turkish_text(text).split() for text in texts]
+            unique_words = dict.fromkeys(word for words in token_lists for word in words)
+            vectors = self.word_cache.get_many(unique_words, self._word_vector)
             
-            # Her kelime için embedding al ve ortala
             embeddings = []
-            for word in words:
-                try:
-                    vec = self.model.get_word_vector(word)
-                    embeddings.append(vec)
-                except:
-                    continue
-            
-            if not embeddings:
-                return None
-            
-            # Ortalama embedding
-            return np.mean(embeddings, axis=0)
+            for words in token_lists:
+                word_vectors = [vectors[word] for word in words if vectors[word] is not None]
+                # Ortalama embedding
+                embeddings.append(np.mean(word_vectors, axis=0) if word_vectors else None)
+            return embeddings
             
         except Exception as e:
             logger.error(f"Embedding hesaplama hatası: {e}")
-            return None
+            return [None] * len(texts)
     
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """İki vektör arasındaki cosine similarity hesaplar."""
-        if vec1 is None or vec2 is None:
-            return 0.0
-        
-        try:
-            dot_product = np.dot(vec1, vec2)
-            norm1 = np.linalg.norm(vec1)
-            norm2 = np.linalg.norm(vec2)
-            
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            
-            similarity = dot_product / (norm1 * norm2)
-            return float(similarity)
-            
-        except Exception as e:
-            logger.error(f"Similarity hesaplama hatası: {e}")
-            return 0.0
+    def _embedding_matrix(self, texts: List[str]) -> np.ndarray:
+        """Metinleri L2-normalize edilmiş (n, d) matrise çevirir.
+
+        Embed edilemeyen metinler atlanır (eski döngüdeki ``continue`` gibi).
+        """
+        vectors = [vec for vec in self._embed_texts(texts) if vec is not None]
+        if not vectors:
+            return np.zeros((0, 0), dtype=EMBEDDING_DTYPE)
+        return normalize_rows(np.vstack(vectors))
     
     def get_event_score(
         self, 
         event_text: str, 
         interest_texts: List[str],
-        tag_overlap_score: int = 0
+        tag_overlap_score: int = 0,
+        event_embedding: Optional[np.ndarray] = None
     ) -> float:
         """
         Etkinlik için öneri skoru hesaplar.
         
+        Tek etkinlik için ``score_batch`` kısayoludur; çok sayıda etkinlik
+        skorlanacaksa ``get_recommendations`` kullanılmalıdır.
+        
         Args:
             event_text: Etkinlik başlığı ve açıklaması
             interest_texts: Öğrencinin ilgi alanları ve geçmiş etkinlikleri
             tag_overlap_score: Tag eşleşme skoru (ek bonus için)
+            event_embedding: Önceden hesaplanmış etkinlik vektörü (varsa
+                event_text yeniden embed edilmez)
             
         Returns:
             Öneri skoru (0-1 arası)
@@ -177,30 +420,18 @@ class TurkishFastTextRecommender:
             return float(tag_overlap_score) * 0.1
         
         try:
-            # Event embedding
-            event_embedding = self._get_text_embedding(event_text)
+            # Event embedding (kayıtlı değilse hesapla)
+            if event_embedding is None:
+                event_embedding = self._get_text_embedding(event_text)
             if event_embedding is None:
                 return float(tag_overlap_score) * 0.1
             
-            # Her ilgi alanı için benzerlik hesapla
-            max_similarity = 0.0
-            
-            for interest_text in interest_texts:
-                interest_embedding = self._get_text_embedding(interest_text)
-                if interest_embedding is None:
-                    continue
-                
-                similarity = self._cosine_similarity(event_embedding, interest_embedding)
-                max_similarity = max(max_similarity, similarity)
-            
-            # FastText benzerliği (0-1) + tag bonus
-            # %70 semantic similarity + %30 tag overlap
-            semantic_score = max_similarity * 0.7
-            tag_score = min(tag_overlap_score * 0.05, 0.3)  # Tag skoru max %30
-            
-            total_score = semantic_score + tag_score
-            
-            return total_score
+            scores = score_batch(
+                normalize_rows(np.asarray(event_embedding).reshape(1, -1)),
+                self._embedding_matrix(interest_texts),
+                [tag_overlap_score],
+            )
+            return float(scores[0])
             
         except Exception as e:
             logger.error(f"Event score hesaplama hatası: {e}")
@@ -211,16 +442,23 @@ class TurkishFastTextRecommender:
         student_interests: List[str],
         student_past_events: List[str],
         candidate_events: List[Tuple[int, str, str, int]],
-        top_k: int = 50
+        top_k: int = 50,
+        event_embeddings: Optional[Dict[int, np.ndarray]] = None
     ) -> List[Tuple[int, float]]:
         """
         Öğrenci için etkinlik önerileri döndürür.
         
+        Tüm aday kümesi tek seferde skorlanır: etkinlik ve ilgi alanı
+        vektörleri normalize edilip matrise dizilir, benzerlikler tek bir
+        matris çarpımı ve satır bazında max ile bulunur (bkz. ``score_batch``).
+        
         Args:
             student_interests: Öğrencinin ilgi alanları (tag isimleri)
             student_past_events: Geçmiş katıldığı etkinlikler (başlık + açıklama)
             candidate_events: Aday etkinlikler (id, title, description, tag_overlap)
             top_k: Kaç öneri döndürülecek
+            event_embeddings: event_id -> kayıtlı etkinlik vektörü. Bulunan
+                etkinlikler için metin yeniden embed edilmez.
             
         Returns:
             (event_id, score) tuple'larının listesi
@@ -244,26 +482,155 @@ class TurkishFastTextRecommender:
                 reverse=True
             )[:top_k]
         
-        # Her etkinlik için skor hesapla
-        event_scores = []
+        if not candidate_events:
+            return []
         
-        for event_id, title, description, tag_overlap in candidate_events:
-            # Etkinlik metni: başlık + açıklama
-            event_text = f"{title} {description}"
-            
-            # Skor hesapla
-            score = self.get_event_score(
-                event_text=event_text,
-                interest_texts=interest_texts,
-                tag_overlap_score=tag_overlap
-            )
-            
-            event_scores.append((event_id, score))
+        event_ids = [event[0] for event in candidate_events]
+        interests = self._embedding_matrix(interest_texts) if self.model_loaded else None
+        scores = self.score_candidates(candidate_events, interests, event_embeddings)
+        return rank_scores(event_ids, scores, top_k)
+
+    def interest_matrix(
+        self, student_interests: List[str], student_past_events: List[str]
+    ) -> Optional[np.ndarray]:
+        """İlgi alanı + geçmiş etkinlik metinlerinin normalize matrisi.
+
+        Model yüklü değilse None döner (sadece tag skoru kullanılır).
+        """
+        self._load_model()
+        if not self.model_loaded:
+            return None
+        return self._embedding_matrix(list(student_interests) + list(student_past_events))
+
+    def score_candidates(
+        self,
+        candidate_events: List[Tuple[int, str, str, int]],
+        interest_matrix: Optional[np.ndarray],
+        event_embeddings: Optional[Dict[int, np.ndarray]] = None,
+    ) -> np.ndarray:
+        """
+        Bir aday grubunu (ör. akıştan gelen bir chunk) skorlar.
+
+        Args:
+            candidate_events: (id, title, description, tag_overlap) listesi
+            interest_matrix: ``interest_matrix`` sonucu; None ise tag-based skor
+            event_embeddings: event_id -> kayıtlı etkinlik vektörü
+
+        Returns:
+            Aday sırasıyla (n,) skor dizisi
+        """
+        tag_overlaps = [event[3] for event in candidate_events]
+        
+        if interest_matrix is None:
+            return np.asarray(tag_overlaps, dtype=np.float64) * 0.1
         
-        # Skora göre sırala ve top_k'yı döndür
-        event_scores.sort(key=lambda x: x[1], reverse=True)
+        # Etkinlik vektörleri (kayıtlı vektör varsa sadece lookup)
+        event_embeddings = event_embeddings or {}
+        vectors = [event_embeddings.get(event[0]) for event in candidate_events]
+        missing = [i for i, vec in enumerate(vectors) if vec is None]
+        if missing:
+            texts = [event_text(candidate_events[i][1], candidate_events[i][2]) for i in missing]
+            for i, vec in zip(missing, self._embed_texts(texts)):
+                vectors[i] = vec
         
-        return event_scores[:top_k]
+        event_matrix, has_vector = stack_vectors(vectors)
+        return score_batch(event_matrix, interest_matrix, tag_overlaps, has_vector)
+
+    def embed_event(self, title: str, description: str) -> Optional[np.ndarray]:
+        """Etkinlik vektörünü hesaplar; model yüklü değilse None döner."""
+        self._load_model()
+        if not self.model_loaded:
+            return None
+        return self._get_text_embedding(event_text(title, description))
+
+    def embed_texts(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Metin listesini toplu embed eder; model yüklü değilse hepsi None."""
+        self._load_model()
+        if not self.model_loaded:
+            return [None] * len(texts)
+        return self._embed_texts(list(texts))
+
+
+class RecommendationCache:
+    """
+    Öğrenci başına sıralı (event_id, score) listelerinin cache'i.
+
+    Anahtarlar iki versiyon sayacı içerir: öğrenciye özel versiyon (ilgi
+    alanı değişimi, katılım) ve tüm etkinliklerin versiyonu (etkinlik
+    ekleme/düzenleme/silme). Versiyon artırmak eski girdileri geçersiz kılar;
+    eski girdiler TTL ile kendiliğinden düşer.
+    """
+
+    EVENTS_VERSION_KEY = "recs:events:version"
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def _student_version_key(student_id) -> str:
+        return f"recs:student:{student_id}:version"
+
+    def _key(self, student_id, top_k: int, day) -> str:
+        return "recs:v{events}:{student}:{version}:{day}:{top_k}".format(
+            events=self.events_version(),
+            student=student_id,
+            version=get_version(self._student_version_key(student_id)),
+            day=day.isoformat(),
+            top_k=top_k,
+        )
+
+    def get_or_compute(
+        self, student_id, top_k: int, day, compute: Callable[[], Optional[List[Tuple[int, float]]]]
+    ) -> Optional[List[Tuple[int, float]]]:
+        """Cache'te varsa döndürür, yoksa ``compute()`` sonucunu TTL ile saklar.
+
+        ``compute()`` None döndürürse (skorlanacak profil yok) sonuç saklanmaz.
+        """
+        from django.conf import settings
+
+        key = self._key(student_id, top_k, day)
+        cached = cache.get(key)
+        if cached is not None:
+            self._count(hit=True)
+            return [tuple(item) for item in cached]
+
+        self._count(hit=False)
+        scores = compute()
+        if scores is None:
+            return None
+        cache.set(key, scores, getattr(settings, "RECOMMENDATION_CACHE_TTL", 300))
+        return scores
+
+    def invalidate_student(self, student_id) -> None:
+        bump_version(self._student_version_key(student_id))
+
+    def events_version(self) -> int:
+        """Etkinlik tablosunun versiyonu (ANN indeksi senkronu için de kullanılır)."""
+        return get_version(self.EVENTS_VERSION_KEY)
+
+    def invalidate_events(self) -> None:
+        bump_version(self.EVENTS_VERSION_KEY)
+
+    def _count(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Bu süreçteki hit/miss sayaçları."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+recommendation_cache = RecommendationCache()
 
 
 # Global singleton instance
@@ -0,0 +1,41 @@
+"""PostgreSQL full-text search over events.
+
+``Event.search_vector`` stores a weighted ``turkish`` tsvector (title A,
+category and club name B, description C) behind a GIN index. It is written
+by a save hook (see signals.py) with a single ``UPDATE``, so the club name is
+read in SQL and bulk writers can refresh many rows with
+``refresh_search_vectors``.
+"""
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, OuterRef, Subquery
+
+from .models import Club
+
+SEARCH_CONFIG = "turkish"
+SEARCH_SOURCE_FIELDS = {"title", "description", "category", "club"}
+
+
+def search_vector_expression():
+    club_name = Subquery(Club.objects.filter(pk=OuterRef("club_id")).values("name")[:1])
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("category", weight="B", config=SEARCH_CONFIG)
+        + SearchVector(club_name, weight="B", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def refresh_search_vectors(queryset) -> int:
+    """Recompute the stored vector of every event in ``queryset``."""
+    return queryset.update(search_vector=search_vector_expression())
+
+
+def search_events(queryset, text: str):
+    """Events matching ``text`` (web search syntax), best rank first."""
+    query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(rank=SearchRank(F("search_vector"), query))
+        .order_by("-rank", "date", "id")
+    )
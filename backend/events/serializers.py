@@ -2,14 +2,9 @@
 
 from rest_framework import serializers
 
-from .models import Club, Event, Favorite, Participation, Student, Tag
-
-
-def normalize_tag_name(s: str) -> str:
- 
-    s = (s or "").strip().lower()
-    s = " ".join(s.split())
-    return s
+from .models import Club, Event, EventNotification, Favorite, Participation, Student, Tag
+from .participation_service import waiting_positions
+from .tags import resolve_tags
 
 
 class TagSerializer(serializers.ModelSerializer):
@@ -58,23 +53,37 @@ class EventSerializer(serializers.ModelSerializer):
             "tag_names",
         )
 
+    def get_fields(self):
+        fields = super().get_fields()
+        side_tables = self.context.get("side_tables")
+        if side_tables is None:
+            return fields
+        # Compact mode (compact.py): ids in place of the nested objects
+        compact = {}
+        for name, field in fields.items():
+            if name == "club" and "club" in side_tables.relations:
+                compact["club_id"] = serializers.IntegerField(read_only=True)
+            elif name == "tags" and "tags" in side_tables.relations:
+                compact["tag_ids"] = serializers.SerializerMethodField()
+            elif name != "club_id" or "club" not in side_tables.relations:
+                compact[name] = field
+        return compact
+
+    def to_representation(self, instance):
+        side_tables = self.context.get("side_tables")
+        if side_tables is not None:
+            side_tables.add(instance)
+        return super().to_representation(instance)
+
+    def get_tag_ids(self, instance):
+        return [tag.id for tag in instance.tags.all()]
+
     def _assign_tags(self, instance: Event, tag_names: list[str]) -> None:
         if not tag_names:
             instance.tags.clear()
             return
 
-        normalized = []
-        for raw in tag_names:
-            name = normalize_tag_name(raw)
-            if name:
-                normalized.append(name)
-
-        tags = []
-        for name in normalized:
-            tag, _ = Tag.objects.get_or_create(name=name)
-            tags.append(tag)
-
-        instance.tags.set(tags)
+        instance.tags.set(resolve_tags(tag_names))
 
     def create(self, validated_data):
         tag_names = validated_data.pop("tag_names", [])
@@ -90,6 +99,36 @@ class EventSerializer(serializers.ModelSerializer):
         return event
 
 
+class EventImportSerializer(serializers.ModelSerializer):
+    """One row of a bulk event import; validation runs without queries.
+
+    ``club_id`` is only type-checked here, the clubs of a whole batch are
+    looked up at once in ``event_import``.
+    """
+
+    club_id = serializers.IntegerField(min_value=1)
+    tag_names = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        allow_empty=True,
+    )
+
+    class Meta:
+        model = Event
+        fields = (
+            "title",
+            "category",
+            "description",
+            "city",
+            "university",
+            "date",
+            "map_url",
+            "capacity",
+            "club_id",
+            "tag_names",
+        )
+
+
 class StudentSerializer(serializers.ModelSerializer):
 
     interests = TagSerializer(many=True, read_only=True)
@@ -190,18 +229,7 @@ class StudentUpdateSerializer(serializers.ModelSerializer):
         instance.save()
 
         if tag_names is not None:
-            normalized = []
-            for raw in tag_names:
-                name = normalize_tag_name(raw)
-                if name:
-                    normalized.append(name)
-
-            tags = []
-            for name in normalized:
-                tag, _ = Tag.objects.get_or_create(name=name)
-                tags.append(tag)
-
-            instance.interests.set(tags)
+            instance.interests.set(resolve_tags(tag_names))
 
         return instance
 
@@ -271,16 +299,28 @@ class ParticipationSerializer(serializers.ModelSerializer):
         model = Participation
         fields = ("id", "student", "event", "status", "created_at", "waiting_position")
 
+    def get_fields(self):
+        fields = super().get_fields()
+        if "student_data" in self.context:
+            # Every row belongs to the same student, serialized once by the view
+            fields.pop("student")
+        return fields
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if "student_data" not in self.context:
+            return data
+        data["student"] = self.context["student_data"]
+        return {name: data[name] for name in self.Meta.fields}
+
     def get_waiting_position(self, instance):
         if instance.status != Participation.STATUS_WAITLISTED:
             return None
-        return (
-            Participation.objects.filter(
-                event=instance.event,
-                status=Participation.STATUS_WAITLISTED,
-                created_at__lte=instance.created_at,
-            ).count()
-        )
+        # Views pass every position at once (participation_service.waiting_positions)
+        positions = self.context.get("waiting_positions")
+        if positions is None:
+            positions = waiting_positions([instance.event_id])
+        return positions.get(instance.pk)
 
 
 class FavoriteSerializer(serializers.ModelSerializer):
@@ -293,3 +333,21 @@ class FavoriteSerializer(serializers.ModelSerializer):
         model = Favorite
         fields = ("id", "student", "event", "event_id", "created_at")
         read_only_fields = ("student", "event", "created_at")
+
+
+class EventNotificationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = EventNotification
+        fields = (
+            "id",
+            "event",
+            "subject",
+            "status",
+            "recipient_count",
+            "sent_count",
+            "failed_count",
+            "created_at",
+            "started_at",
+            "finished_at",
+        )
+        read_only_fields = fields
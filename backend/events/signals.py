@@ -0,0 +1,129 @@
+"""Model signal handlers for the events app."""
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import principal_cache
+from .embeddings import (
+    EMBEDDING_SOURCE_FIELDS,
+    refresh_student_interest_vectors,
+    remove_student_history_vector,
+)
+from .models import Club, Event, Participation, Student, Tag
+from .recommendation_service import recommendation_cache
+from .search import SEARCH_SOURCE_FIELDS, refresh_search_vectors
+from .tags import tag_dictionary
+from .task_queue import enqueue
+
+# Saves touching only these fields do not change recommendation scores.
+EVENT_COUNTER_FIELDS = {"participants_count", "waiting_list_count", "updated_at"}
+M2M_WRITE_ACTIONS = {"post_add", "post_remove", "post_clear"}
+
+
+@receiver(post_save, sender=Event)
+def update_event_embedding(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    # Counter-only saves (join etc.) do not change the embedded text.
+    if update_fields is not None and not EMBEDDING_SOURCE_FIELDS & set(update_fields):
+        return
+    # Embedding a long description is too slow for the request; a worker does it
+    enqueue("refresh_event_embedding", event_id=instance.pk)
+
+
+@receiver(post_save, sender=Event)
+def update_event_search_vector(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not SEARCH_SOURCE_FIELDS & set(update_fields):
+        return
+    refresh_search_vectors(Event.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Club)
+def update_club_events_search_vector(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    # The club name is part of every event vector of the club
+    if update_fields is not None and "name" not in update_fields:
+        return
+    refresh_search_vectors(Event.objects.filter(club=instance))
+
+
+@receiver(post_save, sender=Event)
+def invalidate_recommendations_on_event_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and set(update_fields) <= EVENT_COUNTER_FIELDS:
+        return
+    recommendation_cache.invalidate_events()
+
+
+@receiver(post_delete, sender=Event)
+def invalidate_recommendations_on_event_delete(sender, instance, **kwargs):
+    recommendation_cache.invalidate_events()
+
+
+@receiver(m2m_changed, sender=Event.tags.through)
+def invalidate_recommendations_on_event_tags(sender, action, **kwargs):
+    if action in M2M_WRITE_ACTIONS:
+        recommendation_cache.invalidate_events()
+
+
+@receiver(m2m_changed, sender=Student.interests.through)
+def invalidate_recommendations_on_interests(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in M2M_WRITE_ACTIONS:
+        return
+    if not reverse:
+        recommendation_cache.invalidate_student(instance.pk)
+    elif pk_set:
+        for student_id in pk_set:
+            recommendation_cache.invalidate_student(student_id)
+
+
+@receiver(post_save, sender=Participation)
+@receiver(post_delete, sender=Participation)
+def invalidate_recommendations_on_participation(sender, instance, **kwargs):
+    # Past participations feed both the interest texts and the tag overlap.
+    recommendation_cache.invalidate_student(instance.student_id)
+
+
+@receiver(m2m_changed, sender=Student.interests.through)
+def update_profile_vectors_on_interests(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in M2M_WRITE_ACTIONS:
+        return
+    if not reverse:
+        refresh_student_interest_vectors(instance.pk)
+    elif pk_set:
+        for student_id in pk_set:
+            refresh_student_interest_vectors(student_id)
+
+
+@receiver(post_save, sender=Participation)
+def update_profile_vectors_on_join(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        # The join still holds the Event row lock; patch the profile after commit
+        student_id, event_id = instance.student_id, instance.event_id
+        transaction.on_commit(lambda: enqueue("add_history_vector", student_id=student_id, event_id=event_id))
+
+
+@receiver(post_delete, sender=Participation)
+def update_profile_vectors_on_leave(sender, instance, **kwargs):
+    remove_student_history_vector(instance.student_id, instance.event_id)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_dictionary(sender, **kwargs):
+    tag_dictionary.invalidate()
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+def invalidate_student_principal(sender, instance, **kwargs):
+    principal_cache.invalidate("student", instance.pk)
+
+
+@receiver(post_save, sender=Club)
+@receiver(post_delete, sender=Club)
+def invalidate_club_principal(sender, instance, **kwargs):
+    principal_cache.invalidate("club", instance.pk)
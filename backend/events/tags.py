@@ -0,0 +1,130 @@
+"""Tag name normalization, bulk resolution and the typeahead dictionary."""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .cache_versions import bump_version, get_version
+from .models import Tag
+
+# Turkish upper-case letters whose str.lower() is wrong for Turkish
+_TURKISH_LOWER = str.maketrans({"İ": "i", "I": "ı"})
+# Sort ç, ğ, ö, ş, ü right after c, g, o, s, u (alphabet order); per-letter, so
+# prefix and substring relations between keys are preserved
+_TURKISH_ORDER = str.maketrans({"ç": "c\x7f", "ğ": "g\x7f", "ö": "o\x7f", "ş": "s\x7f", "ü": "u\x7f"})
+
+
+def normalize_tag_name(s: str) -> str:
+    s = (s or "").strip().lower()
+    s = " ".join(s.split())
+    return s
+
+
+def normalize_tag_names(raw_names: Iterable[str]) -> List[str]:
+    """Normalized, non-empty names without duplicates, in first-seen order."""
+    names = (normalize_tag_name(raw) for raw in raw_names)
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def resolve_tags(raw_names: Iterable[str]) -> List[Tag]:
+    """Return a ``Tag`` for every distinct normalized name, creating missing ones.
+
+    At most three queries regardless of the number of names: one ``IN`` lookup,
+    one ``bulk_create`` for the missing names and one lookup to read back
+    their ids. ``ignore_conflicts`` makes concurrent resolvers of the same new
+    name safe; whoever loses the race simply reads the winner's row.
+    """
+    names = normalize_tag_names(raw_names)
+    if not names:
+        return []
+    tags = {tag.name: tag for tag in Tag.objects.filter(name__in=names)}
+    missing = [name for name in names if name not in tags]
+    if missing:
+        Tag.objects.bulk_create([Tag(name=name) for name in missing], ignore_conflicts=True)
+        tags.update((tag.name, tag) for tag in Tag.objects.filter(name__in=missing))
+        # bulk_create sends no post_save
+        tag_dictionary.invalidate()
+    return [tags[name] for name in names]
+
+
+def fold_tag_text(text: str) -> str:
+    """Case-fold for typeahead matching with Turkish casing rules.
+
+    ``İ``/``I`` lower to ``i``/``ı``; the combining dot that ``str.lower``
+    leaves after ``i`` (``"İ".lower() == "i\u0307"``) is dropped. Stored names
+    were lowered with ``str.lower``, which turns ``I`` into ``i``, so dotted
+    and dotless i are matched as the same letter.
+    """
+    return text.translate(_TURKISH_LOWER).lower().replace("\u0307", "").replace("ı", "i")
+
+
+def _sort_key(text: str) -> str:
+    return fold_tag_text(text).translate(_TURKISH_ORDER)
+
+
+class TagDictionary:
+    """
+    Process-local copy of all tags for typeahead.
+
+    Holds the folded names in one array sorted in Turkish alphabet order; a prefix query is a binary
+    search for the start of its range, a substring query is a linear scan of
+    the folded names. The copy is stamped with the ``tags:version`` counter
+    in the shared cache, which any worker bumps on a tag write; the counter is
+    read at most every ``check_interval`` seconds.
+    """
+
+    VERSION_KEY = "tags:version"
+
+    def __init__(self, check_interval: float = 2.0):
+        self.check_interval = check_interval
+        self.version = None
+        self.checked_at = 0.0
+        self._keys: List[str] = []
+        self._tags: List[Tuple[int, str]] = []
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        bump_version(self.VERSION_KEY)
+        with self._lock:
+            self.version = None
+
+    def search(self, query: str = "", limit: int = 50, mode: str = "contains") -> List[Dict]:
+        """Tags whose name starts with (``prefix``) or contains ``query``, in name order."""
+        keys, tags = self._snapshot()
+        folded = _sort_key(query.strip())
+        if not folded:
+            rows = range(min(limit, len(tags)))
+        elif mode == "prefix":
+            start = bisect_left(keys, folded)
+            rows = []
+            for row in range(start, len(keys)):
+                if len(rows) >= limit or not keys[row].startswith(folded):
+                    break
+                rows.append(row)
+        else:
+            rows = [row for row, key in enumerate(keys) if folded in key][:limit]
+        return [{"id": tags[row][0], "name": tags[row][1]} for row in rows]
+
+    def _snapshot(self) -> Tuple[List[str], List[Tuple[int, str]]]:
+        now = time.monotonic()
+        with self._lock:
+            if self.version is not None and now - self.checked_at < self.check_interval:
+                return self._keys, self._tags
+        version = get_version(self.VERSION_KEY)
+        with self._lock:
+            self.checked_at = now
+            if version != self.version:
+                self._load(version)
+            return self._keys, self._tags
+
+    def _load(self, version: Optional[int]) -> None:
+        rows = sorted(
+            (_sort_key(name), tag_id, name) for tag_id, name in Tag.objects.values_list("id", "name")
+        )
+        self._keys = [key for key, _, _ in rows]
+        self._tags = [(tag_id, name) for _, tag_id, name in rows]
+        self.version = version
+
+
+tag_dictionary = TagDictionary()
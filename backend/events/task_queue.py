@@ -0,0 +1,198 @@
+"""Database-backed background task queue.
+
+Views call ``enqueue`` and return immediately; the ``run_worker`` command
+claims due rows with ``SELECT ... FOR UPDATE SKIP LOCKED``, so any number of
+workers can poll the same table without a broker and without two workers
+getting the same task. Because ``enqueue`` is a plain INSERT, a task created
+inside a request transaction only becomes visible to workers once that
+transaction commits.
+
+Handlers are registered with ``@task("name")`` in ``tasks.py`` and receive the
+JSON payload as keyword arguments. A failed attempt is retried with
+exponential backoff (plus jitter) until ``max_attempts``; every attempt
+records its wall time in ``Task.duration_ms``.
+"""
+
+import logging
+import random
+import time
+import traceback
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Avg, Count, F, Max, Min
+from django.utils import timezone
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+TASK_HANDLERS: Dict[str, Callable] = {}
+
+
+def task(name: str):
+    """Register the decorated function as the handler of ``name``."""
+
+    def register(func):
+        TASK_HANDLERS[name] = func
+        return func
+
+    return register
+
+
+def enqueue(name: str, *, delay: Optional[timedelta] = None, max_attempts: Optional[int] = None, **payload) -> Task:
+    """Store a task for the workers; the payload must be JSON serializable.
+
+    With ``TASK_QUEUE_EAGER`` (development without a worker) the task runs in
+    this process right after the surrounding transaction commits.
+    """
+    queued = Task.objects.create(
+        name=name,
+        payload=payload,
+        run_at=timezone.now() + (delay or timedelta()),
+        max_attempts=max_attempts or getattr(settings, "TASK_MAX_ATTEMPTS", 5),
+    )
+    if getattr(settings, "TASK_QUEUE_EAGER", False):
+        transaction.on_commit(lambda: _run_eager(queued.pk))
+    return queued
+
+
+def _run_eager(task_id: int) -> None:
+    now = timezone.now()
+    claimed = Task.objects.filter(pk=task_id, status=Task.STATUS_PENDING).update(
+        status=Task.STATUS_RUNNING,
+        attempts=F("attempts") + 1,
+        locked_by="eager",
+        locked_at=now,
+        started_at=now,
+    )
+    if claimed:
+        run_task(Task.objects.get(pk=task_id))
+
+
+def claim_tasks(worker_id: str, limit: int = 10) -> List[Task]:
+    """Lock up to ``limit`` due tasks for ``worker_id`` and mark them running.
+
+    Rows locked by another worker's claim are skipped instead of waited for;
+    the claim transaction only lasts for these two statements.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        task_ids = list(
+            Task.objects.select_for_update(skip_locked=True)
+            .filter(status=Task.STATUS_PENDING, run_at__lte=now)
+            .order_by("run_at", "id")
+            .values_list("id", flat=True)[:limit]
+        )
+        if not task_ids:
+            return []
+        Task.objects.filter(pk__in=task_ids).update(
+            status=Task.STATUS_RUNNING,
+            attempts=F("attempts") + 1,
+            locked_by=worker_id,
+            locked_at=now,
+            started_at=now,
+            finished_at=None,
+        )
+    return list(Task.objects.filter(pk__in=task_ids).order_by("run_at", "id"))
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff with up to 25% jitter, capped at ``TASK_RETRY_MAX_SECONDS``."""
+    base = getattr(settings, "TASK_RETRY_BASE_SECONDS", 10)
+    cap = getattr(settings, "TASK_RETRY_MAX_SECONDS", 3600)
+    seconds = min(base * 2 ** max(attempts - 1, 0), cap)
+    return timedelta(seconds=seconds * (1 + random.random() * 0.25))
+
+
+def run_task(claimed: Task) -> bool:
+    """Run one claimed task and store its outcome; True on success."""
+    handler = TASK_HANDLERS.get(claimed.name)
+    started = time.perf_counter()
+    error = None
+    if handler is None:
+        error = f"Kayıtlı görev yok: {claimed.name}"
+    else:
+        try:
+            handler(**claimed.payload)
+        except Exception:
+            error = traceback.format_exc()
+    duration_ms = int((time.perf_counter() - started) * 1000)
+    now = timezone.now()
+
+    claimed.duration_ms = duration_ms
+    claimed.finished_at = now
+    claimed.locked_by = ""
+    claimed.locked_at = None
+    if error is None:
+        claimed.status = Task.STATUS_SUCCEEDED
+        claimed.last_error = ""
+    elif handler is None or claimed.attempts >= claimed.max_attempts:
+        claimed.status = Task.STATUS_FAILED
+        claimed.last_error = error
+        logger.error("Görev %s #%s başarısız oldu (%d deneme):\n%s", claimed.name, claimed.pk, claimed.attempts, error)
+    else:
+        claimed.status = Task.STATUS_PENDING
+        claimed.run_at = now + retry_delay(claimed.attempts)
+        claimed.last_error = error
+        logger.warning("Görev %s #%s tekrar denenecek (%d deneme):\n%s", claimed.name, claimed.pk, claimed.attempts, error)
+    claimed.save(
+        update_fields=[
+            "status", "run_at", "duration_ms", "finished_at", "locked_by", "locked_at", "last_error", "updated_at",
+        ]
+    )
+    return error is None
+
+
+def requeue_stale_tasks(timeout: Optional[timedelta] = None) -> int:
+    """Hand tasks of crashed workers (running longer than ``timeout``) back to the queue.
+
+    The lost attempt still counts, so a task that keeps killing its worker
+    eventually ends up failed.
+    """
+    if timeout is None:
+        timeout = timedelta(seconds=getattr(settings, "TASK_STALE_SECONDS", 600))
+    stale = Task.objects.filter(status=Task.STATUS_RUNNING, locked_at__lt=timezone.now() - timeout)
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(
+        status=Task.STATUS_FAILED, locked_by="", locked_at=None, last_error="Worker zaman aşımı"
+    )
+    requeued = stale.update(
+        status=Task.STATUS_PENDING, locked_by="", locked_at=None, last_error="Worker zaman aşımı"
+    )
+    return failed + requeued
+
+
+def purge_finished_tasks(older_than: Optional[timedelta] = None) -> int:
+    """Delete succeeded tasks that finished before the retention window."""
+    if older_than is None:
+        older_than = timedelta(days=getattr(settings, "TASK_RETENTION_DAYS", 7))
+    deleted, _ = Task.objects.filter(
+        status=Task.STATUS_SUCCEEDED, finished_at__lt=timezone.now() - older_than
+    ).delete()
+    return deleted
+
+
+def task_stats() -> dict:
+    """Queue depth, lag and per-task timing, aggregated from the table."""
+    now = timezone.now()
+    by_name: Dict[str, dict] = {}
+    rows = Task.objects.values("name", "status").annotate(
+        count=Count("id"), avg_ms=Avg("duration_ms"), max_ms=Max("duration_ms")
+    )
+    for row in rows:
+        entry = by_name.setdefault(row["name"], {"avg_ms": None, "max_ms": None})
+        entry[row["status"]] = row["count"]
+        if row["status"] == Task.STATUS_SUCCEEDED:
+            entry["avg_ms"] = round(row["avg_ms"], 1) if row["avg_ms"] is not None else None
+            entry["max_ms"] = row["max_ms"]
+
+    oldest_due = Task.objects.filter(status=Task.STATUS_PENDING, run_at__lte=now).aggregate(
+        oldest=Min("run_at")
+    )["oldest"]
+    return {
+        "pending_due": Task.objects.filter(status=Task.STATUS_PENDING, run_at__lte=now).count(),
+        "lag_seconds": round((now - oldest_due).total_seconds(), 1) if oldest_due else 0.0,
+        "tasks": by_name,
+    }
@@ -0,0 +1,44 @@
+"""Background task handlers run by ``run_worker``; see task_queue.py."""
+
+from typing import List
+
+from .embeddings import add_student_history_vector, backfill_event_embeddings, refresh_event_embedding
+from .models import Event, Student
+from .notifications import send_notification
+from .recommendation_pipeline import recommend_for_student
+from .recommendation_service import recommendation_cache
+from .task_queue import task
+
+
+@task("refresh_event_embedding")
+def refresh_event_embedding_task(event_id: int) -> None:
+    event = Event.objects.only("id", "title", "description", "embedding").filter(pk=event_id).first()
+    if event is None:
+        return
+    refresh_event_embedding(event)
+    recommendation_cache.invalidate_events()
+
+
+@task("embed_events")
+def embed_events_task(event_ids: List[int]) -> None:
+    # Invalidates the recommendation cache itself when anything was stored
+    backfill_event_embeddings(Event.objects.filter(pk__in=event_ids))
+
+
+@task("add_history_vector")
+def add_history_vector_task(student_id: int, event_id: int) -> None:
+    # Recommendations cached between the join and this task lack the new row
+    if add_student_history_vector(student_id, event_id):
+        recommendation_cache.invalidate_student(student_id)
+
+
+@task("notify_participants")
+def notify_participants_task(notification_id: int) -> None:
+    send_notification(notification_id)
+
+
+@task("warm_recommendations")
+def warm_recommendations_task(student_id: int, top_k: int = 50) -> None:
+    student = Student.objects.filter(pk=student_id).first()
+    if student is not None:
+        recommend_for_student(student, top_k=top_k)
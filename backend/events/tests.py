@@ -0,0 +1,247 @@
+import os
+from datetime import timedelta
+from smtplib import SMTPException
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Club, Event, EventNotification, Participation, Student, Tag
+from .notifications import create_notification, send_notification
+from .recommendation_pipeline import score_student
+from .recommendation_service import TurkishFastTextRecommender
+
+
+class RecommendationQueryCountTests(TestCase):
+    """Scoring costs the same number of queries for 5 and for 50 events."""
+
+    # İlgi alanı etiketleri, katıldığı etkinliklerin etiketleri, aday akışı.
+    # Model yüklü değilken profil vektörü okunmaz.
+    SCORE_QUERIES = 3
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.today = timezone.localdate()
+        cls.club = Club.objects.create(name="Bilişim Kulübü", university="GSÜ", password="!")
+        cls.tags = [Tag.objects.get_or_create(name=name)[0] for name in ("yapay zeka", "müzik", "spor")]
+        cls.student = Student.objects.create(
+            email="ogrenci@example.com",
+            username="ogrenci",
+            university="GSÜ",
+            department="Bilgisayar",
+            password="!",
+        )
+        cls.student.interests.set(cls.tags[:2])
+
+    def add_events(self, count):
+        start = Event.objects.count()
+        for i in range(start, start + count):
+            event = Event.objects.create(
+                club=self.club,
+                title=f"Etkinlik {i}",
+                category="Teknoloji",
+                city="İstanbul",
+                university="GSÜ",
+                date=self.today + timedelta(days=i % 30),
+            )
+            event.tags.add(self.tags[i % len(self.tags)])
+
+    def score(self):
+        with self.assertNumQueries(self.SCORE_QUERIES):
+            return score_student(self.student, top_k=10, today=self.today)
+
+    def test_query_count_does_not_grow_with_events(self):
+        self.add_events(5)
+        small = self.score()
+        self.assertEqual(len(small), 5)
+
+        self.add_events(45)
+        large = self.score()
+        self.assertEqual(len(large), 10)
+        # Etiket örtüşmesi SQL'de sayılıyor: ilgi alanı etiketli etkinlikler önde
+        tagged = set(Event.objects.filter(tags__in=self.tags[:2]).values_list("id", flat=True))
+        self.assertTrue(all(event_id in tagged for event_id, _ in large))
+
+
+class StudentParticipationsQueryCountTests(TestCase):
+    """The participations list must not fall back to a query per row."""
+
+    @classmethod
+    def setUpTestData(cls):
+        today = timezone.localdate()
+        tags = [Tag.objects.get_or_create(name=name)[0] for name in ("yapay zeka", "müzik", "spor")]
+        clubs = [
+            Club.objects.create(name=f"Kulüp {i}", university="GSÜ", password="!") for i in range(3)
+        ]
+        cls.student, *others = [
+            Student.objects.create(
+                email=f"ogrenci{i}@example.com",
+                username=f"ogrenci{i}",
+                university="GSÜ",
+                department="Bilgisayar",
+                password="!",
+            )
+            for i in range(4)
+        ]
+        cls.student.interests.set(tags[:2])
+
+        cls.expected_positions = {}
+        for i in range(9):
+            event = Event.objects.create(
+                club=clubs[i % len(clubs)],
+                title=f"Etkinlik {i}",
+                category="Teknoloji",
+                city="İstanbul",
+                university="GSÜ",
+                date=today + timedelta(days=i),
+            )
+            event.tags.set(tags[: i % len(tags) + 1])
+            if i % 3 == 0:
+                Participation.objects.create(
+                    student=cls.student, event=event, status=Participation.STATUS_CONFIRMED
+                )
+                continue
+            # Sıradaki yer: öğrenciden önce bekleme listesine giren i % 3 kişi
+            ahead = others[: i % 3]
+            for other in ahead:
+                Participation.objects.create(
+                    student=other, event=event, status=Participation.STATUS_WAITLISTED
+                )
+            waitlisted = Participation.objects.create(
+                student=cls.student, event=event, status=Participation.STATUS_WAITLISTED
+            )
+            cls.expected_positions[waitlisted.pk] = len(ahead) + 1
+
+    def test_participations_query_count(self):
+        url = reverse("student-participations", args=[self.student.pk])
+        # Öğrenci, ilgi alanları, katılımlar (+etkinlik, kulüp), etkinlik etiketleri, sıra numaraları
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        rows = response.json()["participations"]
+        self.assertEqual(len(rows), 9)
+        self.assertEqual(len({row["event"]["club"]["id"] for row in rows}), 3)
+        for row in rows:
+            self.assertEqual(row["student"]["id"], self.student.pk)
+            self.assertEqual(row["waiting_position"], self.expected_positions.get(row["id"]))
+            if row["status"] == Participation.STATUS_WAITLISTED:
+                self.assertIsNotNone(row["waiting_position"])
+
+
+class ReadinessProbeTests(TestCase):
+    """/api/health/ready/ must not wait for a model that is never loaded."""
+
+    def probe(self, recommender):
+        with mock.patch("events.recommendation_service.get_recommender", return_value=recommender):
+            return self.client.get(reverse("health-ready"))
+
+    def test_ready_without_fasttext_in_default_config(self):
+        environ = {key: value for key, value in os.environ.items() if key != "FASTTEXT_ENABLED"}
+        with mock.patch.dict(os.environ, environ, clear=True):
+            response = self.probe(TurkishFastTextRecommender())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "ready", "method": "tag_based"})
+
+    def test_starting_while_model_loads(self):
+        recommender = TurkishFastTextRecommender()
+        with mock.patch.dict(os.environ, {"FASTTEXT_ENABLED": "true"}), \
+                mock.patch.object(recommender, "start_loading") as start_loading:
+            response = self.probe(recommender)
+        self.assertEqual(response.status_code, 503)
+        start_loading.assert_called_once_with()
+
+        # Yükleme denendi (model yoksa tag-based moda düşülür): artık hazır
+        recommender.load_attempted = True
+        with mock.patch.dict(os.environ, {"FASTTEXT_ENABLED": "true"}):
+            self.assertEqual(self.probe(recommender).status_code, 200)
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class SendNotificationTests(TestCase):
+    """Batched fan-out over one connection, resumable from the stored cursor."""
+
+    @classmethod
+    def setUpTestData(cls):
+        club = Club.objects.create(name="Bilişim Kulübü", university="GSÜ", password="!")
+        cls.event = Event.objects.create(
+            club=club,
+            title="Etkinlik",
+            category="Teknoloji",
+            city="İstanbul",
+            university="GSÜ",
+            date=timezone.localdate(),
+        )
+        for i in range(9):
+            student = Student.objects.create(
+                email=f"ogrenci{i}@example.com",
+                username=f"ogrenci{i}",
+                university="GSÜ",
+                department="Bilgisayar",
+                password="!",
+            )
+            # Son ikisi bekleme listesinde: bildirim almazlar
+            status = Participation.STATUS_CONFIRMED if i < 7 else Participation.STATUS_WAITLISTED
+            Participation.objects.create(student=student, event=cls.event, status=status)
+        cls.confirmed = [f"ogrenci{i}@example.com" for i in range(7)]
+
+    def setUp(self):
+        self.notification = create_notification(self.event, "Duyuru", "Etkinlik saati değişti.")
+
+    def test_sends_in_batches_over_one_connection(self):
+        self.assertEqual(self.notification.recipient_count, 7)
+        with mock.patch("events.notifications.get_connection", wraps=mail.get_connection) as get_connection, \
+                mock.patch.object(EmailBackend, "send_messages", autospec=True,
+                                  side_effect=EmailBackend.send_messages) as send_messages:
+            notification = send_notification(self.notification.pk, batch_size=3)
+
+        get_connection.assert_called_once()
+        self.assertEqual([len(call.args[1]) for call in send_messages.call_args_list], [3, 3, 1])
+        self.assertEqual([message.to for message in mail.outbox], [[email] for email in self.confirmed])
+        self.assertEqual(notification.status, EventNotification.STATUS_SENT)
+        self.assertEqual((notification.sent_count, notification.failed_count), (7, 0))
+        self.assertEqual(notification.cursor, self.confirmed[-1])
+        self.assertIsNotNone(notification.finished_at)
+
+    def test_resumes_after_stored_cursor(self):
+        # Önceki deneme ilk dört alıcıdan sonra kesildi
+        EventNotification.objects.filter(pk=self.notification.pk).update(
+            status=EventNotification.STATUS_SENDING, sent_count=4, cursor=self.confirmed[3]
+        )
+        notification = send_notification(self.notification.pk, batch_size=3)
+
+        self.assertEqual([message.to[0] for message in mail.outbox], self.confirmed[4:])
+        self.assertEqual(notification.status, EventNotification.STATUS_SENT)
+        self.assertEqual((notification.sent_count, notification.failed_count), (7, 0))
+
+    def test_failed_batch_is_counted_and_sending_continues(self):
+        calls = []
+        deliver = EmailBackend.send_messages
+
+        def first_batch_fails(backend, messages):
+            calls.append(len(messages))
+            if len(calls) == 1:
+                raise SMTPException("bağlantı koptu")
+            return deliver(backend, messages)
+
+        with mock.patch.object(EmailBackend, "send_messages", autospec=True, side_effect=first_batch_fails):
+            notification = send_notification(self.notification.pk, batch_size=3)
+
+        self.assertEqual(calls, [3, 3, 1])
+        self.assertEqual(len(mail.outbox), 4)
+        self.assertEqual(notification.status, EventNotification.STATUS_SENT)
+        self.assertEqual((notification.sent_count, notification.failed_count), (4, 3))
+        self.assertIn("bağlantı koptu", notification.last_error)
+
+    def test_every_batch_failing_marks_the_notification_failed(self):
+        with mock.patch.object(EmailBackend, "send_messages", autospec=True, side_effect=SMTPException("kapalı")):
+            notification = send_notification(self.notification.pk, batch_size=3)
+
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(notification.status, EventNotification.STATUS_FAILED)
+        self.assertEqual((notification.sent_count, notification.failed_count), (0, 7))
+        # Tamamlanmış bildirim yeniden gönderilmez
+        self.assertEqual(send_notification(notification.pk).failed_count, 7)
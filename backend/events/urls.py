@@ -9,11 +9,14 @@ from .views import (
     ClubRegisterView,
     EventViewSet,
     FavoriteView,
+    HealthView,
     StudentLoginView,
     StudentParticipationsView,
     StudentRegisterView,
     RecommendationView,
     MetaTagsView,
+    MetricsView,
+    ReadinessView,
     StudentProfileView,
 )
 
@@ -34,6 +37,9 @@ urlpatterns = [
     path("clubs/<int:pk>/", ClubProfileView.as_view(), name="club-profile"),
 
     path("recommendations/", RecommendationView.as_view(), name="recommendations"),  # ✅ ekle
+    path("health/", HealthView.as_view(), name="health"),
+    path("health/ready/", ReadinessView.as_view(), name="health-ready"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
 
     path("", include(router.urls)),
 ]
@@ -2,18 +2,32 @@
 
 import logging
 
-from django.db import transaction
+from django.db.models import Value
+from django.db.models.functions import Lower
 from django.shortcuts import get_object_or_404
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Club, Event, Favorite, Participation, Student, Tag
+from .authentication import principal_cache
+from .compact import compact_context, with_side_tables
+from .event_import import import_events
+from .event_rows import event_rows
+from .filters import filter_events
+from .models import Club, Event, Favorite, Participation, Student
+from .notifications import create_notification
+from .pagination import EventKeysetPagination, EventSearchPagination
+from .participation_service import cancel_participation, join_event, waiting_positions
+from .recommendation_pipeline import load_ranked_events, recommend_for_student
+from .search import search_events
+from .tags import tag_dictionary
+from .task_queue import enqueue, task_stats
 from .serializers import (
     ClubAuthSerializer,
     ClubRegistrationSerializer,
     ClubUpdateSerializer,
+    EventNotificationSerializer,
     EventSerializer,
     FavoriteSerializer,
     ParticipationSerializer,
@@ -27,75 +41,192 @@ RefreshToken = None
 logger = logging.getLogger(__name__)
 
 
+def request_student(request, student_id=None):
+    """Student behind the request: the token's principal, else ``student_id``.
+
+    Clients without a (valid) token keep sending ``student_id``; an id that
+    differs from the token's student is looked up like before. None when
+    neither is given; 404 for an unknown id.
+    """
+    user = request.user
+    if isinstance(user, Student) and (not student_id or str(student_id) == str(user.pk)):
+        return user
+    if not student_id:
+        return None
+    return get_object_or_404(Student, pk=student_id)
+
+
 class EventViewSet(viewsets.ModelViewSet):
     queryset = Event.objects.select_related("club").prefetch_related("tags")
     serializer_class = EventSerializer
+    pagination_class = EventKeysetPagination
+    BULK_MAX_ROWS = 1000
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ("list", "search"):
+            queryset = filter_events(queryset, self.request.query_params)
+        return queryset
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        # ?format=compact / ?expand= (compact.py); only for the list responses
+        self.compact = compact_context(request) if self.action in ("list", "search") else {}
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context.update(getattr(self, "compact", {}))
+        return context
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        with_side_tables(response.data, self.compact)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        if self.compact:
+            return super().list(request, *args, **kwargs)
+        # Read-only fast path (event_rows.py); the page itself only needs (date, id)
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(
+            queryset.select_related(None).prefetch_related(None).only("id", "date")
+        )
+        return self.get_paginated_response(event_rows(event.pk for event in page))
+
+    @action(detail=False, methods=["get"], url_path="search")
+    def search(self, request):
+        """Full-text search; accepts the list filters too (``?q=...&city=...``)."""
+        text = request.query_params.get("q", "").strip()
+        if not text:
+            return Response(
+                {"detail": "q parametresi zorunludur."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        queryset = search_events(self.get_queryset(), text)
+        paginator = EventSearchPagination()
+        if self.compact:
+            page = paginator.paginate_queryset(queryset, request, view=self)
+            data = self.get_serializer(page, many=True).data
+        else:
+            page = paginator.paginate_queryset(
+                queryset.select_related(None).prefetch_related(None).only("id"), request, view=self
+            )
+            data = event_rows(event.pk for event in page)
+        response = paginator.get_paginated_response(data)
+        with_side_tables(response.data, self.compact)
+        return response
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        """Create many events at once; body is a list or ``{"club_id": .., "events": [..]}``."""
+        payload = request.data
+        default_club_id = None
+        if isinstance(payload, dict):
+            default_club_id = payload.get("club_id")
+            payload = payload.get("events")
+        if not isinstance(payload, list) or not payload:
+            return Response(
+                {"detail": "Etkinlik listesi zorunludur."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(payload) > self.BULK_MAX_ROWS:
+            return Response(
+                {"detail": f"Tek istekte en fazla {self.BULK_MAX_ROWS} etkinlik gönderilebilir."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        report = import_events(payload, default_club_id=default_club_id)
+        return Response(
+            report.as_dict(),
+            status=status.HTTP_201_CREATED if report.event_ids else status.HTTP_400_BAD_REQUEST,
+        )
 
     @action(detail=True, methods=["post"], url_path="join")
     def join(self, request, pk=None):
         event = self.get_object()
-        student_id = request.data.get("student_id")
-        if not student_id:
+        student = request_student(request, request.data.get("student_id"))
+        if student is None:
             return Response(
                 {"detail": "student_id zorunludur."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        student = get_object_or_404(Student, pk=student_id)
-        with transaction.atomic():
-            participation, created = Participation.objects.get_or_create(
-                student=student, event=event
+        participation, created = join_event(event, student)
+        if not created:
+            return Response(
+                {"detail": "Bu etkinliğe zaten katılım isteğiniz var."},
+                status=status.HTTP_200_OK,
             )
-            if not created:
-                return Response(
-                    {"detail": "Bu etkinliğe zaten katılım isteğiniz var."},
-                    status=status.HTTP_200_OK,
-                )
-
-            if event.is_full:
-                participation.status = Participation.STATUS_WAITLISTED
-                event.waiting_list_count += 1
-                message = "Etkinlik kontenjanı dolu. Bekleme listesine eklendiniz."
-            else:
-                participation.status = Participation.STATUS_CONFIRMED
-                event.participants_count += 1
-                message = "Katılım isteğiniz alındı."
 
-            participation.save()
-            event.save()
+        if participation.status == Participation.STATUS_WAITLISTED:
+            message = "Etkinlik kontenjanı dolu. Bekleme listesine eklendiniz."
+        else:
+            message = "Katılım isteğiniz alındı."
 
         serializer = self.get_serializer(event)
         return Response(
             {"event": serializer.data, "message": message, "status": participation.status}
         )
 
+    @action(detail=True, methods=["post"], url_path="cancel")
+    def cancel(self, request, pk=None):
+        event = self.get_object()
+        student = request_student(request, request.data.get("student_id"))
+        if student is None:
+            return Response(
+                {"detail": "student_id zorunludur."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        participation, promoted = cancel_participation(event, student)
+        if participation is None:
+            return Response(
+                {"detail": "Bu etkinlik için katılım kaydınız bulunamadı."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        serializer = self.get_serializer(event)
+        return Response(
+            {
+                "event": serializer.data,
+                "message": "Katılımınız iptal edildi.",
+                "promoted_student_ids": [p.student_id for p in promoted],
+            }
+        )
+
     @action(detail=True, methods=["post"], url_path="notify")
     def notify_participants(self, request, pk=None):
         event = self.get_object()
-        participants = Participation.objects.filter(event=event, status=Participation.STATUS_CONFIRMED)
-        participant_emails = participants.values_list("student__email", flat=True).distinct()
-        count = len(participant_emails)
         subject = request.data.get("subject") or f"{event.title} hakkında bilgilendirme"
-        # Actual mailing would happen here; for now we just log the intent.
-        logger.info(
-            "Kulüp e-postası: etkinlik %s için '%s' başlıklı mesaj %d kişiye gönderildi.",
-            event.id,
-            subject,
-            count,
-        )
+        body = request.data.get("body") or f"{event.title} etkinliğiyle ilgili yeni bir duyuru var."
+        notification = create_notification(event, subject, body)
+        # Gönderim worker'da gruplar halinde yapılır; istek beklemeden döner
+        enqueue("notify_participants", notification_id=notification.pk)
         return Response(
             {
-                "message": f"{count} kişiye mail gönderildi.",
-                "recipient_count": count,
-            }
+                "message": f"{notification.recipient_count} kişiye mail gönderimi kuyruğa alındı.",
+                "recipient_count": notification.recipient_count,
+                "notification": EventNotificationSerializer(notification).data,
+            },
+            status=status.HTTP_202_ACCEPTED,
         )
 
+    @action(detail=True, methods=["get"], url_path="notifications")
+    def notifications(self, request, pk=None):
+        """Delivery progress of the event's mailings, newest first."""
+        event = self.get_object()
+        return Response(EventNotificationSerializer(event.notifications.all(), many=True).data)
+
 
 class StudentLoginView(APIView):
     def post(self, request):
         try:
             email = request.data.get("email", "").strip().lower()
             password = request.data.get("password", "")
-            student = Student.objects.filter(email__iexact=email).first()
+            # Matches the LOWER(email) index; iexact compiles to UPPER() on PostgreSQL
+            student = (
+                Student.objects.annotate(email_lower=Lower("email"))
+                .filter(email_lower=Lower(Value(email)))
+                .first()
+            )
             if not student or not student.check_password(password):
                 return Response(
                     {"detail": "E-posta veya şifre hatalı."},
@@ -108,6 +239,8 @@ class StudentLoginView(APIView):
                 logger.exception("JWT library not available for student login")
                 return Response({"detail": "Sunucuda JWT kütüphanesi bulunamadı."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             refresh = _RefreshToken.for_user(student)
+            # Student and club ids overlap; the role tells them apart (authentication.py)
+            refresh["role"] = "student"
             return Response(
                 {
                     "role": "student",
@@ -128,10 +261,14 @@ class ClubLoginView(APIView):
             club_name = request.data.get("club_name", "").strip()
             password = request.data.get("password", "")
 
-            club = Club.objects.filter(
-                university__iexact=university,
-                name__iexact=club_name
-            ).first()
+            club = (
+                Club.objects.annotate(university_lower=Lower("university"), name_lower=Lower("name"))
+                .filter(
+                    university_lower=Lower(Value(university)),
+                    name_lower=Lower(Value(club_name)),
+                )
+                .first()
+            )
 
             if not club or not club.check_password(password):
                 return Response(
@@ -144,6 +281,7 @@ class ClubLoginView(APIView):
                 logger.exception("JWT library not available for club login")
                 return Response({"detail": "Sunucuda JWT kütüphanesi bulunamadı."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             refresh = _RefreshToken.for_user(club)
+            refresh["role"] = "club"
             return Response({
                 "role": "club",
                 "club": ClubAuthSerializer(club).data,
@@ -181,31 +319,39 @@ class ClubRegisterView(APIView):
 class FavoriteView(APIView):
     def get(self, request):
         student_id = request.query_params.get("student_id")
+        if isinstance(request.user, Student) and not student_id:
+            student_id = request.user.pk
         if not student_id:
             return Response(
                 {"detail": "student_id zorunludur."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        favorites = Favorite.objects.filter(student_id=student_id).select_related("event", "event__club")
+        favorites = (
+            Favorite.objects.filter(student_id=student_id)
+            .select_related("event", "event__club")
+            .prefetch_related("event__tags")
+        )
         event_ids = list(favorites.values_list("event_id", flat=True))
-        serializer = FavoriteSerializer(favorites, many=True)
-        return Response({"event_ids": event_ids, "favorites": serializer.data})
+        context = compact_context(request)
+        serializer = FavoriteSerializer(favorites, many=True, context=context)
+        return Response(with_side_tables({"event_ids": event_ids, "favorites": serializer.data}, context))
 
     def post(self, request):
-        student_id = request.data.get("student_id")
         event_id = request.data.get("event_id")
-        if not student_id or not event_id:
+        student = request_student(request, request.data.get("student_id"))
+        if student is None or not event_id:
             return Response(
                 {"detail": "student_id ve event_id zorunludur."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        student = get_object_or_404(Student, pk=student_id)
         event = get_object_or_404(Event, pk=event_id)
         Favorite.objects.get_or_create(student=student, event=event)
         return Response({"detail": "Favorilere eklendi."}, status=status.HTTP_201_CREATED)
 
     def delete(self, request):
         student_id = request.data.get("student_id")
+        if isinstance(request.user, Student) and not student_id:
+            student_id = request.user.pk
         event_id = request.data.get("event_id")
         if not student_id or not event_id:
             return Response(
@@ -223,101 +369,104 @@ class RecommendationView(APIView):
     """FastText tabanlı Türkçe semantik öneriler ve tag bazlı öneriler."""
 
     def get(self, request):
-        student_id = request.query_params.get("student_id")
-        if not student_id:
+        student = request_student(request, request.query_params.get("student_id"))
+        if student is None:
             return Response({"detail": "student_id zorunludur."}, status=status.HTTP_400_BAD_REQUEST)
         
-        student = get_object_or_404(Student, pk=student_id)
-        from django.db.models import Count, Q, F
-        from django.utils import timezone
         from .recommendation_service import get_recommender
 
-        # Öğrencinin ilgi alanları
-        interest_tags = list(student.interests.values_list("name", flat=True))
-        
-        # Geçmiş katıldığı etkinliklerin tagları
-        past_tag_ids = list(
-            Tag.objects.filter(events__participations__student=student)
-            .values_list("id", flat=True)
-        )
-        
-        # Geçmiş katıldığı etkinliklerin başlık ve açıklamaları
-        past_events = list(
-            Event.objects.filter(participations__student=student)
-            .values_list("title", "description")
-        )
-        past_event_texts = [f"{title} {desc}" for title, desc in past_events]
+        # Sıralı (event_id, score) listesi; öğrenci başına cache'lenir
+        event_scores = recommend_for_student(student, top_k=50)
         
-        # Tüm ilgili tag ID'leri
-        interest_tag_ids = list(student.interests.values_list("id", flat=True))
-        all_tag_ids = list(set(interest_tag_ids) | set(past_tag_ids))
-        
-        if not interest_tags and not past_event_texts:
+        if event_scores is None:
             return Response(
                 {
                     "recommendations": [],
                     "message": "İlgi alanı veya geçmiş katılımınız yok. Lütfen profilinizden ilgi alanlarınızı güncelleyin.",
                 }
             )
-
-        today = timezone.localdate()
-        
-        # Aday etkinlikleri getir (gelecek etkinlikler)
-        candidate_events = (
-            Event.objects.filter(date__gte=today)
-            .select_related("club")
-            .prefetch_related("tags")
-        )
-        
-        # Her etkinlik için tag overlap skorunu hesapla
-        event_data = []
-        for event in candidate_events:
-            event_tag_ids = set(event.tags.values_list("id", flat=True))
-            tag_overlap = len(event_tag_ids & set(all_tag_ids))
-            
-            event_data.append((
-                event.id,
-                event.title,
-                event.description,
-                tag_overlap,
-                event  # Sonra serializer için lazım
-            ))
         
-        # FastText recommender ile skorları hesapla
+        # Sadece kazanan etkinlikler serialize edilir
+        context = compact_context(request)
+        if context:
+            data = EventSerializer(load_ranked_events(event_scores), many=True, context=context).data
+        else:
+            data = event_rows(event_id for event_id, _ in event_scores)
+        return Response(with_side_tables({
+            "recommendations": data,
+            "method": "fasttext_semantic" if get_recommender().model_loaded else "tag_based"
+        }, context))
+
+
+class MetricsView(APIView):
+    """Process-local performance counters (per gunicorn worker)."""
+
+    def get(self, request):
+        import os
+
+        from .recommendation_service import get_recommender, recommendation_cache
+
+        return Response({
+            "pid": os.getpid(),
+            "recommendation_cache": recommendation_cache.stats(),
+            "word_vector_cache": get_recommender().word_cache.stats(),
+            "principal_cache": principal_cache.stats(),
+            "task_queue": task_stats(),
+        })
+
+
+class HealthView(APIView):
+    """Liveness probe for the load balancer; touches neither the DB nor the model."""
+
+    def get(self, request):
+        return Response({"status": "ok"})
+
+
+class ReadinessView(APIView):
+    """Readiness probe: 503 while this worker's FastText model is still loading.
+
+    With FastText disabled there is nothing to wait for; with it enabled but
+    not preloaded, the first probe starts the load in the background.
+    """
+
+    def get(self, request):
+        from .recommendation_service import get_recommender
+
         recommender = get_recommender()
-        event_scores = recommender.get_recommendations(
-            student_interests=interest_tags,
-            student_past_events=past_event_texts,
-            candidate_events=[(e[0], e[1], e[2], e[3]) for e in event_data],
-            top_k=50
-        )
-        
-        # Skorlara göre sıralanmış event ID'leri
-        recommended_event_ids = [event_id for event_id, score in event_scores]
-        
-        # Event objelerini sıralı şekilde al
-        event_dict = {e[0]: e[4] for e in event_data}
-        recommended_events = [event_dict[eid] for eid in recommended_event_ids if eid in event_dict]
-        
-        serializer = EventSerializer(recommended_events, many=True)
+        if not recommender.is_ready:
+            recommender.start_loading()
+            return Response({"status": "starting"}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
         return Response({
-            "recommendations": serializer.data,
-            "method": "fasttext_semantic" if recommender.model_loaded else "tag_based"
+            "status": "ready",
+            "method": "fasttext_semantic" if recommender.model_loaded else "tag_based",
         })
 
 
 class MetaTagsView(APIView):
-    """Return tag suggestions for typeahead. Query param `q` filters by name."""
+    """Return tag suggestions for typeahead.
+
+    Query params: `q` filters by name, `mode` is `contains` (default) or
+    `prefix`, `limit` caps the result count (default 50). Answered from the
+    process-local tag dictionary, not the database.
+    """
+
+    MAX_LIMIT = 500
 
     def get(self, request):
         q = request.query_params.get("q", "").strip()
-        qs = Tag.objects.all()
-        if q:
-            qs = qs.filter(name__icontains=q)
-        tags = qs.order_by("name")[0:50]
+        mode = request.query_params.get("mode", "contains")
+        if mode not in ("contains", "prefix"):
+            return Response(
+                {"detail": "mode 'contains' veya 'prefix' olmalıdır."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            limit = int(request.query_params.get("limit", 50))
+        except ValueError:
+            limit = 50
+        limit = max(1, min(limit, self.MAX_LIMIT))
         # return list of simple objects
-        data = [{"id": t.id, "name": t.name} for t in tags]
-        return Response(data)
+        return Response(tag_dictionary.search(q, limit=limit, mode=mode))
 
 
 class StudentProfileView(APIView):
@@ -353,43 +502,15 @@ class StudentProfileView(APIView):
             "interests_changed": interests_changed
         }
         
-        # Eğer ilgi alanları değiştiyse, yeni önerileri de gönder
-        if interests_changed and request.query_params.get('include_recommendations') == 'true':
-            from django.utils import timezone
-            from .recommendation_service import get_recommender
-            
-            # Yeni önerileri hesapla
-            interest_tags = list(student.interests.values_list("name", flat=True))
-            past_events = list(
-                Event.objects.filter(participations__student=student)
-                .values_list("title", "description")
-            )
-            past_event_texts = [f"{title} {desc}" for title, desc in past_events]
-            
-            today = timezone.localdate()
-            candidate_events = Event.objects.filter(date__gte=today).select_related("club").prefetch_related("tags")
-            
-            event_data = []
-            all_tag_ids = set(student.interests.values_list("id", flat=True))
-            
-            for event in candidate_events:
-                event_tag_ids = set(event.tags.values_list("id", flat=True))
-                tag_overlap = len(event_tag_ids & all_tag_ids)
-                event_data.append((event.id, event.title, event.description, tag_overlap, event))
-            
-            recommender = get_recommender()
-            event_scores = recommender.get_recommendations(
-                student_interests=interest_tags,
-                student_past_events=past_event_texts,
-                candidate_events=[(e[0], e[1], e[2], e[3]) for e in event_data],
-                top_k=20
-            )
-            
-            recommended_event_ids = [event_id for event_id, score in event_scores]
-            event_dict = {e[0]: e[4] for e in event_data}
-            recommended_events = [event_dict[eid] for eid in recommended_event_ids if eid in event_dict]
-            
-            response_data["updated_recommendations"] = EventSerializer(recommended_events, many=True).data
+        if interests_changed:
+            # Öneri listesi worker'da ısıtılır; RecommendationView cache'ten okur
+            enqueue("warm_recommendations", student_id=student.pk, top_k=50)
+            # Eski istemciler için: istenirse yeni öneriler yine senkron döner
+            if request.query_params.get('include_recommendations') == 'true':
+                event_scores = recommend_for_student(student, top_k=20) or []
+                response_data["updated_recommendations"] = event_rows(
+                    event_id for event_id, _ in event_scores
+                )
         
         return Response(response_data)
 
@@ -398,14 +519,23 @@ class StudentParticipationsView(APIView):
     """List participations (events) for a student."""
 
     def get(self, request, pk=None):
-        student = get_object_or_404(Student, pk=pk)
+        student = get_object_or_404(Student.objects.prefetch_related("interests"), pk=pk)
         participations = (
             Participation.objects.filter(student=student)
             .select_related("event", "event__club")
+            .prefetch_related("event__tags")
             .order_by("-created_at")
         )
-        serializer = ParticipationSerializer(participations, many=True)
-        return Response({"participations": serializer.data})
+        positions = waiting_positions(
+            p.event_id for p in participations if p.status == Participation.STATUS_WAITLISTED
+        )
+        context = {
+            "waiting_positions": positions,
+            "student_data": StudentSerializer(student).data,
+            **compact_context(request),
+        }
+        serializer = ParticipationSerializer(participations, many=True, context=context)
+        return Response(with_side_tables({"participations": serializer.data}, context))
 
 
 class ClubProfileView(APIView):
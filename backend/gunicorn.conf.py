@@ -0,0 +1,52 @@
+"""Gunicorn configuration for UniConnect backend.
+
+With FASTTEXT_PRELOAD=true the Django app and the FastText vectors are loaded
+once in the master before any worker is forked, so every worker shares the
+same memory pages copy-on-write and no user pays the model cold start.
+
+Workers are threaded (gthread); each thread has its own database connection.
+"""
+
+import gc
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+# Threads per worker: password hashing (argon2/PBKDF2) and DB waits release
+# the GIL, so a slow login no longer blocks the whole worker.
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+preload_app = os.environ.get("FASTTEXT_PRELOAD", "false").lower() == "true"
+
+
+def when_ready(server):
+    # Runs in the master after the app is imported and before workers spawn.
+    if not preload_app:
+        return
+    from events.recommendation_service import get_recommender
+
+    recommender = get_recommender()
+    recommender.preload()
+    server.log.info("FastText preload finished (model_loaded=%s)", recommender.model_loaded)
+
+
+def pre_fork(server, worker):
+    # Move everything allocated so far out of the GC's reach; otherwise the
+    # first collection in a worker touches (and copies) the shared pages.
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # Connections opened in the master must not be shared between workers.
+    from django.db import connections
+
+    connections.close_all()
+
+
+def post_worker_init(worker):
+    # Runs after the worker loaded the app. Without preload each worker loads
+    # the model itself, in the background, and /api/health/ready/ answers 503
+    # until it is done (no-op if preloaded or FastText is disabled).
+    from events.recommendation_service import get_recommender
+
+    get_recommender().start_loading()
@@ -1,5 +1,6 @@
 """Django settings for UniConnect backend."""
 
+from datetime import timedelta
 from pathlib import Path
 import os
 from dotenv import load_dotenv
@@ -10,6 +11,12 @@ try:
 except ImportError:
     dj_database_url = None
 
+try:
+    import argon2  # noqa: F401
+    ARGON2_AVAILABLE = True
+except ImportError:
+    ARGON2_AVAILABLE = False
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv(BASE_DIR / ".env")
 
@@ -27,6 +34,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "corsheaders",
     "rest_framework",
     "events",
@@ -87,6 +95,90 @@ else:
         }
     }
 
+# Cache - sürüm sayaçları (öneri, etiket sözlüğü, ANN indeksi) web ve worker
+# süreçleri arasında paylaşılmalı: REDIS_URL varsa Redis, DATABASE_URL varsa
+# (Render) veritabanı cache'i (build.sh createcachetable çalıştırır), yoksa
+# tek süreçli geliştirme için bellek. CACHE_BACKEND=redis|db|locmem ile zorlanabilir.
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "").lower() or (
+    "redis" if os.environ.get("REDIS_URL") else "db" if os.environ.get("DATABASE_URL") else "locmem"
+)
+if CACHE_BACKEND == "redis":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ.get("REDIS_URL", "redis://localhost:6379/0"),
+        }
+    }
+elif CACHE_BACKEND == "db":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "uniconnect_cache",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Öğrenci başına öneri listesi cache süresi (saniye)
+RECOMMENDATION_CACHE_TTL = int(os.environ.get("RECOMMENDATION_CACHE_TTL", "300"))
+# Bu sayıdan fazla vektörlü gelecek etkinlik varsa ANN indeksi ilk aday
+# eleme aşaması olarak kullanılır; RECALL kadar en yakın etkinlik kesin skorlanır.
+# benchmark_ann: ANN ~10-15 bin etkinliğin altında tam taramadan yavaş.
+RECOMMENDATION_ANN_MIN_EVENTS = int(os.environ.get("RECOMMENDATION_ANN_MIN_EVENTS", "15000"))
+RECOMMENDATION_ANN_RECALL = int(os.environ.get("RECOMMENDATION_ANN_RECALL", "500"))
+
+# Arka plan görev kuyruğu (events/task_queue.py, `manage.py run_worker`).
+# EAGER=true: worker olmadan geliştirme için görevler commit sonrası aynı süreçte çalışır.
+TASK_QUEUE_EAGER = os.environ.get("TASK_QUEUE_EAGER", "false").lower() == "true"
+TASK_MAX_ATTEMPTS = int(os.environ.get("TASK_MAX_ATTEMPTS", "5"))
+# Yeniden deneme gecikmesi: BASE * 2^(deneme-1) saniye, en fazla MAX
+TASK_RETRY_BASE_SECONDS = int(os.environ.get("TASK_RETRY_BASE_SECONDS", "10"))
+TASK_RETRY_MAX_SECONDS = int(os.environ.get("TASK_RETRY_MAX_SECONDS", "3600"))
+# Bu süreden uzun "running" kalan görevin worker'ı çökmüş sayılır
+TASK_STALE_SECONDS = int(os.environ.get("TASK_STALE_SECONDS", "600"))
+TASK_RETENTION_DAYS = int(os.environ.get("TASK_RETENTION_DAYS", "7"))
+
+# E-posta: varsayılan console backend'i mailleri worker çıktısına yazar.
+# Testlerde locmem veya file backend (EMAIL_FILE_PATH) kullanılabilir.
+EMAIL_BACKEND = os.environ.get("EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend")
+EMAIL_HOST = os.environ.get("EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.environ.get("EMAIL_PORT", "25"))
+EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS = os.environ.get("EMAIL_USE_TLS", "false").lower() == "true"
+EMAIL_TIMEOUT = int(os.environ.get("EMAIL_TIMEOUT", "30"))
+if os.environ.get("EMAIL_FILE_PATH"):
+    EMAIL_FILE_PATH = os.environ["EMAIL_FILE_PATH"]
+DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL", "UniConnect <noreply@uniconnect.local>")
+# Kulüp bildirimlerinde tek SMTP bağlantısından bir seferde gönderilen mail sayısı
+NOTIFICATION_BATCH_SIZE = int(os.environ.get("NOTIFICATION_BATCH_SIZE", "100"))
+
+# Yeni şifreler PASSWORD_HASHER ile saklanır ("argon2" veya "pbkdf2"); listedeki
+# diğer hasher'lar eski hash'leri doğrular ve girişte yeni politikaya taşınır
+# (events/passwords.py). argon2-cffi yoksa PBKDF2'ye düşülür.
+PASSWORD_HASHER = os.environ.get("PASSWORD_HASHER", "argon2")
+ARGON2_TIME_COST = int(os.environ.get("ARGON2_TIME_COST", "2"))
+ARGON2_MEMORY_COST = int(os.environ.get("ARGON2_MEMORY_COST", "19456"))  # KiB
+ARGON2_PARALLELISM = int(os.environ.get("ARGON2_PARALLELISM", "1"))
+# Süreç başına aynı anda çalışan hash hesaplaması
+PASSWORD_HASH_CONCURRENCY = int(os.environ.get("PASSWORD_HASH_CONCURRENCY", "2"))
+
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+if ARGON2_AVAILABLE:
+    if PASSWORD_HASHER == "argon2":
+        PASSWORD_HASHERS.insert(0, "events.passwords.TunedArgon2PasswordHasher")
+    else:
+        PASSWORD_HASHERS.insert(1, "events.passwords.TunedArgon2PasswordHasher")
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -119,8 +211,22 @@ REST_FRAMEWORK = {
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
     ],
+    # Geçersiz/eksik token isteği reddetmez, anonim bırakır (events/authentication.py)
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "events.authentication.TokenPrincipalAuthentication",
+    ],
+    # ?format= renderer seçimi için değil, compact yanıt modu için (events/compact.py)
+    "URL_FORMAT_OVERRIDE": None,
 }
 
+SIMPLE_JWT = {
+    "ACCESS_TOKEN_LIFETIME": timedelta(minutes=int(os.environ.get("JWT_ACCESS_MINUTES", "60"))),
+    "REFRESH_TOKEN_LIFETIME": timedelta(days=int(os.environ.get("JWT_REFRESH_DAYS", "7"))),
+    "UPDATE_LAST_LOGIN": False,
+}
+# Token'daki öğrenci/kulübün süreç içi cache süresi (saniye)
+AUTH_PRINCIPAL_CACHE_TTL = int(os.environ.get("AUTH_PRINCIPAL_CACHE_TTL", "30"))
+
 cors_origins_raw = os.environ.get(
     "CORS_ALLOWED_ORIGINS", "https://zeynep-genc.github.io,http://localhost:5173,http://127.0.0.1:5173"
 )
@@ -141,3 +247,9 @@ CORS_ALLOW_CREDENTIALS = True
 
 # FastText Model Path
 FASTTEXT_MODEL_PATH = os.path.join(BASE_DIR, 'ml_models', 'cc.tr.300.bin')
+# Budanmış float16 vektörler (export_fasttext_vectors); varsa tam modelin yerine kullanılır
+FASTTEXT_VECTORS_PATH = os.environ.get(
+    "FASTTEXT_VECTORS_PATH", os.path.join(BASE_DIR, 'ml_models', 'cc.tr.300.pruned.npy')
+)
+# Süreç başına kelime vektörü LRU cache boyutu (300 boyutta ~1.2 KB/kelime); 0 kapatır
+FASTTEXT_WORD_CACHE_SIZE = int(os.environ.get("FASTTEXT_WORD_CACHE_SIZE", "20000"))
@@ -33,7 +33,10 @@ function clearSession() {
 
 export default function App() {
   const [events, setEvents] = useState([]);
+  const [eventsCursor, setEventsCursor] = useState(null);
+  const [loadingMoreEvents, setLoadingMoreEvents] = useState(false);
   const [favorites, setFavorites] = useState([]);
+  const [favoriteEvents, setFavoriteEvents] = useState([]);
   const [recommendations, setRecommendations] = useState([]);
   const [recommendationNotice, setRecommendationNotice] = useState("");
   const [loadingEvents, setLoadingEvents] = useState(true);
@@ -49,13 +52,14 @@ export default function App() {
 
   useEffect(() => {
     loadEvents();
-  }, []);
+  }, [view, club?.id]);
 
   useEffect(() => {
     if (student?.id) {
       loadFavorites(student.id);
     } else {
       setFavorites([]);
+      setFavoriteEvents([]);
     }
   }, [student?.id]);
 
@@ -92,14 +96,31 @@ export default function App() {
   }, []);
 
 
+  // Öğrenciler yaklaşan etkinlikleri, kulüpler geçmiş dahil kendi etkinliklerini görür
+  const isClubView = view === "club" && Boolean(club?.id);
+
+  function eventFilters() {
+    return isClubView ? { club: club.id, date_from: "", page_size: "200" } : {};
+  }
+
   async function loadEvents() {
     setLoadingEvents(true);
     try {
-      const apiEvents = await api.getEvents();
-      setEvents(apiEvents);
+      const page = await api.getEvents(eventFilters());
+      const loaded = [...page.events];
+      let next = page.next;
+      // Kulüp yönetim ekranı (liste, istatistikler) kulübün tüm etkinliklerine ihtiyaç duyar
+      while (isClubView && next) {
+        const more = await api.getEvents(eventFilters(), next);
+        loaded.push(...more.events);
+        next = more.next;
+      }
+      setEvents(loaded);
+      setEventsCursor(next);
       setGlobalError("");
     } catch (error) {
       setEvents(MOCK_EVENTS);
+      setEventsCursor(null);
       setGlobalError(
         "API erişilemedi. Demo verileri ile çalışma moduna geçildi."
       );
@@ -108,6 +129,23 @@ export default function App() {
     }
   }
 
+  async function loadMoreEvents() {
+    if (!eventsCursor || loadingMoreEvents) return;
+    setLoadingMoreEvents(true);
+    try {
+      const page = await api.getEvents(eventFilters(), eventsCursor);
+      setEvents((prev) => {
+        const seen = new Set(prev.map((e) => e.id));
+        return [...prev, ...page.events.filter((e) => !seen.has(e.id))];
+      });
+      setEventsCursor(page.next);
+    } catch (error) {
+      console.warn("Etkinlikler yüklenemedi.", error);
+    } finally {
+      setLoadingMoreEvents(false);
+    }
+  }
+
   async function loadRecommendations() {
     if (!student?.id) {
       setRecommendations([]);
@@ -128,14 +166,17 @@ export default function App() {
   async function loadFavorites(studentId) {
     if (!studentId) {
       setFavorites([]);
+      setFavoriteEvents([]);
       return;
     }
     try {
-      const ids = await api.getFavorites(studentId);
+      const { ids, events: favorited } = await api.getFavorites(studentId);
       setFavorites(ids);
+      setFavoriteEvents(favorited);
     } catch (error) {
       console.warn("Favoriler alınamadı.", error);
       setFavorites([]);
+      setFavoriteEvents([]);
     }
   }
 
@@ -200,6 +241,7 @@ export default function App() {
   function handleLogout() {
     setView("auth");
     setFavorites([]);
+    setFavoriteEvents([]);
     setStudent(null);
     setClub(null);
     try {
@@ -268,6 +310,21 @@ export default function App() {
     };
   }
 
+  async function handleCancelParticipation(eventId) {
+    if (!student?.id) {
+      throw new Error("Öğrenci bilgileri bulunamadı.");
+    }
+    const response = await api.cancelParticipation(eventId, {
+      student_id: student.id,
+    });
+
+    const updatedEvent = response.event;
+    setEvents((prev) =>
+      prev.map((e) => (e.id === updatedEvent.id ? updatedEvent : e))
+    );
+    return response;
+  }
+
   const studentData = student || FALLBACK_STUDENT;
   const clubData = club || FALLBACK_CLUB;
 
@@ -300,9 +357,14 @@ export default function App() {
         <StudentDashboard
           events={events}
           favorites={favorites}
+          favoriteEvents={favoriteEvents}
           onToggleFavorite={toggleFavorite}
           onJoinEvent={handleJoinEvent}
+          onCancelParticipation={handleCancelParticipation}
           loading={loadingEvents}
+          hasMoreEvents={Boolean(eventsCursor)}
+          loadingMoreEvents={loadingMoreEvents}
+          onLoadMoreEvents={loadMoreEvents}
           student={studentData}
           recommendations={recommendations}
           recommendationNotice={recommendationNotice}
@@ -72,14 +72,53 @@ async function request(path, options = {}) {
 /* -------------------- RECOMMENDATIONS -------------------- */
 
 export async function getRecommendations(studentId) {
-  return request(`/recommendations/?student_id=${encodeURIComponent(studentId)}`);
+  const data = await request(
+    `/recommendations/?student_id=${encodeURIComponent(studentId)}&format=compact`
+  );
+  if (data?.recommendations) data.recommendations = inflateEvents(data.recommendations, data);
+  return data;
+}
+
+/**
+ * `?format=compact` responses carry club_id/tag_ids plus `clubs`/`tags`
+ * side tables; rebuild the nested `club` and `tags` the components use.
+ */
+function inflateEvents(events, data) {
+  const clubs = new Map((data?.clubs || []).map((club) => [club.id, club]));
+  const tags = new Map((data?.tags || []).map((tag) => [tag.id, tag]));
+  return events.map((event) => ({
+    ...event,
+    club: event.club || clubs.get(event.club_id),
+    tags: event.tags || (event.tag_ids || []).map((id) => tags.get(id)).filter(Boolean),
+  }));
 }
 
 /* -------------------- EVENTS -------------------- */
 
-export async function getEvents() {
-  const data = await request("/events/");
-  return Array.isArray(data) ? data : data?.results || [];
+function todayISO() {
+  const now = new Date();
+  const pad = (n) => String(n).padStart(2, "0");
+  return `${now.getFullYear()}-${pad(now.getMonth() + 1)}-${pad(now.getDate())}`;
+}
+
+/**
+ * One cursor page of /events/: upcoming events only unless `date_from` is
+ * overridden (pass "" for every date). Pass the returned `next` back as
+ * `cursor` to load the following page.
+ */
+export async function getEvents(filters = {}, cursor = null) {
+  const params = new URLSearchParams({
+    page_size: "100",
+    format: "compact",
+    date_from: todayISO(),
+    ...filters,
+  });
+  const data = await request(cursor || `/events/?${params.toString()}`);
+  if (Array.isArray(data)) return { events: data, next: null };
+  return {
+    events: inflateEvents(data?.results || [], data),
+    next: data?.next ? `/events/${new URL(data.next).search}` : null,
+  };
 }
 
 export async function createEvent(payload) {
@@ -96,6 +135,13 @@ export async function joinEvent(eventId, payload) {
   });
 }
 
+export async function cancelParticipation(eventId, payload) {
+  return request(`/events/${eventId}/cancel/`, {
+    method: "POST",
+    body: JSON.stringify(payload),
+  });
+}
+
 export async function sendEventMail(eventId, payload = {}) {
   return request(`/events/${encodeURIComponent(eventId)}/notify/`, {
     method: "POST",
@@ -143,8 +189,15 @@ export async function updateClub(clubId, payload) {
 /* -------------------- FAVORITES -------------------- */
 
 export async function getFavorites(studentId) {
-  const data = await request(`/favorites/?student_id=${encodeURIComponent(studentId)}`);
-  return data?.event_ids || [];
+  // Favori etkinlikler yüklenen etkinlik sayfasında olmayabilir; nesneleri de döndür
+  const data = await request(
+    `/favorites/?student_id=${encodeURIComponent(studentId)}&format=compact`
+  );
+  const favorites = data?.favorites || [];
+  return {
+    ids: data?.event_ids || [],
+    events: inflateEvents(favorites.map((favorite) => favorite.event).filter(Boolean), data),
+  };
 }
 
 export async function addFavorite(studentId, eventId) {
@@ -66,9 +66,14 @@ function getParticipationStatusLabel(status) {
 export default function StudentDashboard({
   events,
   favorites,
+  favoriteEvents: loadedFavoriteEvents = [],
   onToggleFavorite,
   onJoinEvent,
+  onCancelParticipation,
   loading,
+  hasMoreEvents = false,
+  loadingMoreEvents = false,
+  onLoadMoreEvents,
   student,
   onUpdateStudent,
   recommendations = [],
@@ -126,8 +131,8 @@ export default function StudentDashboard({
       // İlgi alanları değişti mi kontrol et
       const tagsChanged = JSON.stringify([...oldTagNames].sort()) !== JSON.stringify([...newTagNames].sort());
 
-      // İlgi alanları değiştiyse include_recommendations=true ile güncelle
-      const updated = await api.updateStudent(student.id, payload, tagsChanged);
+      // Öneriler sunucuda arka planda ısıtılır; aşağıda ayrıca yüklenir
+      const updated = await api.updateStudent(student.id, payload);
       
       // updated is the student object or API wrapper; our backend returns {message, student}
       const newStudent = updated.student || updated;
@@ -374,7 +379,14 @@ export default function StudentDashboard({
   }, [selectedCategory, selectedUniversity, selectedCity, filteredRecommendations.length]);
 
   const recommended = (filteredRecommendations && filteredRecommendations.length > 0) ? filteredRecommendations.slice(0, 3) : [];
-  const favoriteEvents = events.filter((event) => favorites.includes(event.id));
+  const favoriteEvents = useMemo(() => {
+    // Sayfalı listede olmayan favoriler favori uç noktasından gelir
+    const byId = new Map();
+    [...loadedFavoriteEvents, ...events].forEach((event) => {
+      if (favorites.includes(event.id)) byId.set(event.id, event);
+    });
+    return Array.from(byId.values());
+  }, [events, loadedFavoriteEvents, favorites]);
 
   async function handleJoinClick(event) {
     if (!onJoinEvent) return;
@@ -395,6 +407,23 @@ export default function StudentDashboard({
     }
   }
 
+  async function handleCancelClick(event) {
+    if (!onCancelParticipation) return;
+    try {
+      const response = await onCancelParticipation(event.id);
+      setJoinResult({
+        title: "Katılım İptali",
+        message: response.message || "Katılımınız iptal edildi.",
+      });
+      await loadParticipations();
+    } catch (error) {
+      setJoinResult({
+        title: "Katılım iptal edilemedi",
+        message: error.message || "Lütfen daha sonra tekrar deneyiniz.",
+      });
+    }
+  }
+
   const studentInfo = student || {};
   const gradeLabel = getGradeLabel(studentInfo.grade);
 
@@ -645,6 +674,12 @@ export default function StudentDashboard({
                         >
                           Detay
                         </button>
+                        <button
+                          className="btn small secondary"
+                          onClick={() => handleCancelClick(event)}
+                        >
+                          İptal Et
+                        </button>
                         <span
                           className={`status-pill status-${entry.status}`}
                           role="status"
@@ -916,6 +951,17 @@ export default function StudentDashboard({
                   })}
                 </div>
               )}
+              {!loading && hasMoreEvents && (
+                <div style={{ display: "flex", justifyContent: "center", marginTop: 12 }}>
+                  <button
+                    className="btn secondary"
+                    onClick={onLoadMoreEvents}
+                    disabled={loadingMoreEvents}
+                  >
+                    {loadingMoreEvents ? "Yükleniyor..." : "Daha fazla etkinlik"}
+                  </button>
+                </div>
+              )}
             </div>
             <div className="card">
               <div className="section-title">Favori Etkinliklerim</div>